@@ -1,8 +1,262 @@
 """Baseline extraction for debug pipeline."""
 
+import json
+import os
 import re
+import time
+from bisect import bisect_right
+from collections import Counter
+from itertools import accumulate
 from typing import List, Dict, Any, Optional, Set, Tuple
+import fitz  # PyMuPDF
 from pdf2json.parser import PDFTextExtractor
+from pdf2json.extractor import HEBREW_TO_LATIN
+
+
+# Agent debug log: opt-in via PDF2JSON_DEBUG, written to .cursor/debug.log.
+# Records are batched and flushed through one buffered handle, so a disabled
+# log costs a single flag check per call site.
+_DEBUG = bool(os.environ.get("PDF2JSON_DEBUG"))
+_DEBUG_LOG_PATH = os.path.join(".cursor", "debug.log")
+_DEBUG_SESSION = {"sessionId": "debug-baseline"}
+_log_fh = None
+_log_batch: List[str] = []
+
+
+def _debug_log(run_id: str, hypothesis_id: str, location: str, message: str, data: Dict[str, Any]) -> None:
+    """Queue a debug-log record; written out by _flush_debug_log()."""
+    record = dict(_DEBUG_SESSION, runId=run_id, hypothesisId=hypothesis_id, location=location,
+                  message=message, data=data, timestamp=time.time() * 1000)
+    _log_batch.append(json.dumps(record, separators=(",", ":")) + "\n")
+
+
+def _flush_debug_log() -> None:
+    """Write queued debug-log records, opening the log file on first use."""
+    global _log_fh
+    if not _log_batch:
+        return
+    if _log_fh is None:
+        _log_fh = open(_DEBUG_LOG_PATH, "a", encoding="utf-8", buffering=1 << 16)
+    _log_fh.writelines(_log_batch)
+    _log_fh.flush()
+    _log_batch.clear()
+
+
+# Precompiled patterns (compiled once at import, not per page/line)
+# Paragraph number alone on its line (dot on the next line): "22", "81א"
+_NUMBER_ONLY_RE = re.compile(r'^(\d{1,3})([א-ת]{1,3})?$')
+# Paragraph number formats, tried in priority order by one alternation:
+#   nd: primary number-dot with optional Hebrew suffix: "5.", "81א.", "17 ."
+#   dn: fallback dot-number: ".1 ", ".16 "
+#   pn: fallback plain number: "1 ", "16 "
+_PARAGRAPH_NUMBER_RE = re.compile(
+    r'^(?:(?P<nd>\d{1,3})(?P<nds>[א-ת]{1,3})?\s*\.\s*'
+    r'|\.(?P<dn>\d{1,3})(?P<dns>[א-ת]{1,3})?\s+'
+    r'|(?P<pn>\d{1,3})(?P<pns>[א-ת]{1,3})?\s+)'
+)
+# Plain number on its own, for primary markers that fail the content check
+_PLAIN_NUMBER_RE = re.compile(r'^(\d{1,3})([א-ת]{1,3})?\s+')
+_TOC_RE = re.compile(r'תוכן\s+עניינים', re.IGNORECASE)
+_HEBREW_TITLE_RE = re.compile(r'תקן\s+חשבונאות\s+בינלאומי\s+(\d+)', re.IGNORECASE)
+_ENGLISH_TITLE_RE = re.compile(r'International\s+Accounting\s+Standard\s+(\d+)', re.IGNORECASE)
+# Title-case phrase, possibly comma-separated: "Property, Plant and Equipment"
+_TITLE_PHRASE_RE = re.compile(r'^[A-Z][a-z]+(?:\s+[a-z]+)*(?:\s*,\s*[A-Z][a-z]+(?:\s+[a-z]+)*)*$')
+_SINGLE_CAP_RE = re.compile(r'^[A-Z][a-z]{3,}$')
+# Header words that are not part of the English subject. Phrases are rejected if
+# they contain one anywhere (substring, e.g. "Standards"); single words by equality.
+_TITLE_SKIP_WORD_RE = re.compile(r'International|Accounting|Standard|Financial|Reporting')
+_TITLE_SKIP_WORDS = frozenset({"International", "Accounting", "Standard", "Financial", "Reporting", "The"})
+_TITLE_END_RE = re.compile(r'\d{4}|\d{1,2}/\d{1,2}')
+_HEBREW_CHAR_RE = re.compile(r'[א-ת]')
+_COMMA_RE = re.compile(r'\s*,\s*')
+# Text flags for page.get_text("text"): the defaults minus CID substitution for
+# unknown glyphs. Keep the mediabox clip; without it off-page text leaks in.
+_PAGE_TEXT_FLAGS = fitz.TEXT_PRESERVE_LIGATURES | fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP
+# Deletes the Hebrew letters א-ת (final forms included); used for character-class tests
+_HEBREW_LETTERS_DELETE = str.maketrans("", "", "".join(map(chr, range(ord("א"), ord("ת") + 1))))
+# Hebrew suffix letters -> Latin, applied in one str.translate pass
+_HEBREW_TO_LATIN_TABLE = str.maketrans(HEBREW_TO_LATIN)
+
+
+def _is_hebrew_subject(line_text: str) -> bool:
+    """Check for a short Hebrew subject line: 4-30 Hebrew letters/whitespace, at most 4 words."""
+    return (4 <= len(line_text) <= 30
+            and not line_text.translate(_HEBREW_LETTERS_DELETE).strip()
+            and len(line_text.split()) <= 4)
+
+
+def _find_match_line(pattern: "re.Pattern", text: str, line_ends: List[int], match: Optional["re.Match"]) -> Optional[int]:
+    """Find the index of the first line that contains a match on its own.
+    
+    Args:
+        pattern: Compiled pattern that produced `match`
+        text: Lines joined with "\n"
+        line_ends: Cumulative end offsets (len(line) + 1) of each line in `text`
+        match: First match of `pattern` in `text`, reused to avoid a second scan
+        
+    Returns:
+        Line index, or None if every match spans a line break
+    """
+    while match:
+        start_idx = bisect_right(line_ends, match.start())
+        if bisect_right(line_ends, match.end() - 1) == start_idx:
+            return start_idx
+        match = pattern.search(text, match.start() + 1)
+    return None
+
+
+def _scan_lines(lines: List[str], page_num: int, standard_id: str, candidates: List[Dict[str, Any]]) -> None:
+    """Extract paragraph candidates from one non-TOC page.
+    
+    Args:
+        lines: Stripped, non-empty text lines of the page
+        page_num: Page number (1-indexed)
+        standard_id: Standard ID (e.g., "IAS_16")
+        candidates: List that paragraph candidate dictionaries are appended to
+    """
+    # Plain, self-free function with concrete types so it stays compilable with
+    # mypyc/Cython. Bind the precompiled matchers once; they run for every line.
+    match_number_only_re = _NUMBER_ONLY_RE.match
+    match_paragraph_number = _PARAGRAPH_NUMBER_RE.match
+    match_plain_number = _PLAIN_NUMBER_RE.match
+    append_candidate = candidates.append
+    n_lines: int = len(lines)
+    
+    # #region agent log
+    if _DEBUG:
+        _debug_log("run1", "E", "baseline.py:205", "Processing non-TOC page", {"page": page_num, "line_count": len(lines), "sample_lines": lines[:10] if lines else []})
+    # #endregion
+    
+    # Process each line on this page
+    for line_idx, line_text in enumerate(lines):
+        if not line_text:
+            continue
+        
+        # Every paragraph marker starts with a digit or a dot; skip prose lines
+        # without entering the regex engine (isdecimal() is what \d matches).
+        # A page-level multiline finditer for these lines was measured slower:
+        # about one line in six starts with a digit, so the per-match overhead
+        # outweighs this first-character test.
+        first_char = line_text[0]
+        if first_char != "." and not first_char.isdecimal():
+            continue
+        
+        matched = False
+        number = None
+        suffix = None
+        suffix_display = None
+        regex_name = None
+        
+        # Check for number-dot on separate lines: "22" followed by "." on next line
+        # This handles cases where paragraph number and dot are split across lines
+        if line_idx + 1 < n_lines:
+            next_line = lines[line_idx + 1]
+            # Pattern: current line is just a number (possibly with Hebrew suffix), next line is just "."
+            match_number_only = match_number_only_re(line_text)
+            if match_number_only and next_line == '.':
+                number = match_number_only[1]
+                suffix_hebrew = match_number_only[2]  # None when there is no suffix
+                # Check if line after "." has content
+                content_line_idx = line_idx + 2
+                has_content = False
+                if content_line_idx < n_lines:
+                    content_line = lines[content_line_idx]
+                    has_content = bool(content_line and len(content_line) > 2)
+                
+                if has_content:
+                    if suffix_hebrew:
+                        suffix = suffix_hebrew.translate(_HEBREW_TO_LATIN_TABLE)
+                        suffix_display = suffix_hebrew
+                    else:
+                        suffix = None
+                        suffix_display = None
+                    regex_name = "number-dot-separate"
+                    matched = True
+        
+        # All three single-line formats are tried with one combined match:
+        # PRIMARY "5.", "81א.", "17 ." (dot AFTER number/letters; number may be alone on its line),
+        # FALLBACK 1 ".1 ", ".81א " (other PDF formats), FALLBACK 2 "1 ", "81א " (no dots)
+        if not matched:
+            match_para = match_paragraph_number(line_text)
+            if match_para:
+                rest = line_text[match_para.end():].strip()
+                suffix_hebrew = None
+                if match_para["nd"]:
+                    # Accept if content on same line OR next line is not empty (even if short)
+                    if (rest and len(rest) > 2) or (line_idx + 1 < n_lines and lines[line_idx + 1]):
+                        number = match_para["nd"]
+                        suffix_hebrew = match_para["nds"]
+                        regex_name = "number-dot"
+                    else:
+                        # "17 . text" without enough content may still pass as a plain number
+                        match_plain = match_plain_number(line_text)
+                        if match_plain:
+                            rest = line_text[match_plain.end():].strip()
+                            if rest and len(rest) > 5:
+                                number = match_plain[1]
+                                suffix_hebrew = match_plain[2]
+                                regex_name = "plain-number"
+                elif match_para["dn"]:
+                    if rest and len(rest) > 2:
+                        number = match_para["dn"]
+                        suffix_hebrew = match_para["dns"]
+                        regex_name = "dot-number"
+                elif rest and len(rest) > 5:
+                    # Only use plain number if it has meaningful content
+                    number = match_para["pn"]
+                    suffix_hebrew = match_para["pns"]
+                    regex_name = "plain-number"
+                
+                if regex_name:
+                    if suffix_hebrew:
+                        # Handles multi-letter Hebrew too (e.g., "יד" -> "ID")
+                        suffix = suffix_hebrew.translate(_HEBREW_TO_LATIN_TABLE)
+                        suffix_display = suffix_hebrew
+                    matched = True
+        
+        if matched and number:
+            # Build token_raw (display version)
+            token_raw = number
+            if suffix_display:
+                token_raw += suffix_display
+            
+            # Build canonical token
+            if suffix:
+                token = f"{standard_id}:{number}{suffix}"
+            else:
+                token = f"{standard_id}:{number}"
+            
+            # Build snippet: matched_line + next_line if available
+            matched_line = line_text
+            snippet = matched_line
+            
+            # Always try to add next line if available (paragraph number may be on its own line)
+            if line_idx + 1 < n_lines:
+                next_line = lines[line_idx + 1]
+                if next_line:
+                    # If matched_line is just the paragraph number (e.g., "1."), use next line as snippet
+                    if len(matched_line) <= 5:  # Just "1." or "81א."
+                        snippet = next_line[:80]
+                    else:
+                        snippet = f"{matched_line} {next_line[:80]}"
+            
+            # Ensure snippet is not empty (use matched_line if needed)
+            if not snippet.strip():
+                snippet = matched_line[:80] if matched_line else ""
+            
+            # #region agent log
+            if _DEBUG:
+                _debug_log("run2", "ALL", "baseline.py:285", "Candidate added", {"page": page_num, "token": token, "token_raw": token_raw, "regex_name": regex_name})
+            # #endregion
+            
+            append_candidate({
+                "page": page_num,
+                "token": token,
+                "token_raw": token_raw,
+                "matched_line": matched_line,
+                "snippet": snippet,
+                "regex_name": regex_name
+            })
 
 
 class BaselineExtractor:
@@ -28,32 +282,53 @@ class BaselineExtractor:
         if not self.pdf_extractor.doc:
             raise ValueError("PDF document not open. Use context manager.")
         
-        # Get per-page text using page.get_text("text")
-        page_texts: Dict[int, List[str]] = {}
+        # Stream pages: TOC detection and paragraph candidates run as each page is
+        # read, so only page 1's lines (for the title step) are kept around
+        toc_pages: Set[int] = set()
+        paragraph_candidates: List[Dict[str, Any]] = []
+        page1_lines: List[str] = []
+        total_pages = len(self.pdf_extractor.doc)
         # #region agent log
-        import json; log_file = open('.cursor/debug.log', 'a', encoding='utf-8'); log_file.write(json.dumps({"sessionId": "debug-baseline", "runId": "run1", "hypothesisId": "A", "location": "baseline.py:31", "message": "Starting page text extraction", "data": {"total_pages": len(self.pdf_extractor.doc)}, "timestamp": __import__("time").time() * 1000}) + "\n"); log_file.close()
+        if _DEBUG:
+            _debug_log("run1", "A", "baseline.py:31", "Starting page text extraction", {"total_pages": total_pages})
         # #endregion
-        for page_num in range(len(self.pdf_extractor.doc)):
-            page = self.pdf_extractor.doc[page_num]
-            page_text = page.get_text("text")
-            # Split into lines and filter empty
-            lines = [line.strip() for line in page_text.split("\n") if line.strip()]
-            page_texts[page_num + 1] = lines  # 1-indexed page numbers
+        # Pages are read sequentially: a PyMuPDF Document must not be shared
+        # across threads, and get_text() holds the GIL, so a thread pool
+        # cannot overlap extractions anyway
+        for page_num, page in enumerate(self.pdf_extractor.doc, 1):  # 1-indexed page numbers
+            page_text = page.get_text("text", flags=_PAGE_TEXT_FLAGS, sort=False)
+            # Split into lines and filter empty (one strip per line)
+            lines = [line for line in map(str.strip, page_text.splitlines()) if line]
+            # #region agent log
+            if _DEBUG:
+                _debug_log("run1", "D", "baseline.py:38", "Page text extracted", {"page": page_num, "text_length": len(page_text), "line_count": len(lines), "sample_lines": lines[:5] if lines else []})
+            # #endregion
+            if page_num == 1:
+                page1_lines = lines
+            
+            # Skip TOC pages; extract paragraph candidates from the rest
+            if self._is_toc_page(lines):
+                toc_pages.add(page_num)
+                # #region agent log
+                if _DEBUG:
+                    _debug_log("run1", "C", "baseline.py:201", "Skipping TOC page", {"page": page_num})
+                # #endregion
+            else:
+                _scan_lines(lines, page_num, standard_id, paragraph_candidates)
             # #region agent log
-            import json; log_file = open('.cursor/debug.log', 'a', encoding='utf-8'); log_file.write(json.dumps({"sessionId": "debug-baseline", "runId": "run1", "hypothesisId": "D", "location": f"baseline.py:38", "message": "Page text extracted", "data": {"page": page_num + 1, "text_length": len(page_text), "line_count": len(lines), "sample_lines": lines[:5] if lines else []}, "timestamp": __import__("time").time() * 1000}) + "\n"); log_file.close()
+            if _DEBUG:
+                _flush_debug_log()
             # #endregion
         
-        # Extract TOC pages
-        toc_pages = self._extract_toc_pages(page_texts)
         # #region agent log
-        import json; log_file = open('.cursor/debug.log', 'a', encoding='utf-8'); log_file.write(json.dumps({"sessionId": "debug-baseline", "runId": "run1", "hypothesisId": "C", "location": "baseline.py:42", "message": "TOC pages detected", "data": {"toc_pages": sorted(list(toc_pages)), "total_pages": len(page_texts)}, "timestamp": __import__("time").time() * 1000}) + "\n"); log_file.close()
+        if _DEBUG:
+            _debug_log("run1", "C", "baseline.py:42", "TOC pages detected", {"toc_pages": sorted(list(toc_pages)), "total_pages": total_pages})
+            _debug_log("run1", "ALL", "baseline.py:275", "Paragraph candidates extraction complete", {"total_candidates": len(paragraph_candidates), "candidates_by_page": Counter(c["page"] for c in paragraph_candidates)})
+            _flush_debug_log()
         # #endregion
         
         # Extract title candidates from page 1
-        title_candidates = self._extract_title_candidates(page_texts.get(1, []))
-        
-        # Extract paragraph candidates from non-TOC pages
-        paragraph_candidates = self._extract_paragraph_candidates(page_texts, toc_pages, standard_id)
+        title_candidates = self._extract_title_candidates(page1_lines)
         
         baseline = {
             "toc_pages": sorted(list(toc_pages)),
@@ -68,24 +343,18 @@ class BaselineExtractor:
         
         return baseline
     
-    def _extract_toc_pages(self, page_texts: Dict[int, List[str]]) -> Set[int]:
-        """Extract page numbers containing TOC.
+    def _is_toc_page(self, lines: List[str]) -> bool:
+        """Check whether a page contains the TOC heading.
         
         Args:
-            page_texts: Dictionary mapping page numbers to lists of lines
+            lines: Text lines of the page
             
         Returns:
-            Set of page numbers containing TOC
+            True if any line contains "תוכן עניינים"
         """
-        toc_pattern = re.compile(r'תוכן\s+עניינים', re.IGNORECASE)
-        toc_pages = set()
-        
-        for page_num, lines in page_texts.items():
-            page_text = "\n".join(lines)
-            if toc_pattern.search(page_text):
-                toc_pages.add(page_num)
-        
-        return toc_pages
+        # Scan lines directly instead of re-joining the page into one string
+        search_toc = _TOC_RE.search
+        return any(search_toc(line) for line in lines)
     
     def _extract_title_candidates(self, page1_lines: List[str]) -> Dict[str, Any]:
         """Extract title candidates from page 1.
@@ -100,27 +369,25 @@ class BaselineExtractor:
             return {"hebrew": None, "english": None}
         
         page1_text = "\n".join(page1_lines)
+        # Line end offsets in page1_text, to map match positions back to lines
+        line_ends = list(accumulate(len(line) + 1 for line in page1_lines))
         
         # Extract Hebrew title
-        hebrew_pattern = re.compile(r'תקן\s+חשבונאות\s+בינלאומי\s+(\d+)', re.IGNORECASE)
         hebrew_title = None
         standard_number = None
         
-        hebrew_match = hebrew_pattern.search(page1_text)
+        # Cheap substring prefilter; the regex only runs when the marker word is present
+        hebrew_match = _HEBREW_TITLE_RE.search(page1_text) if "תקן" in page1_text else None
         if hebrew_match:
             standard_number = hebrew_match.group(1)
             # Find next meaningful Hebrew line (subject)
-            match_line_idx = None
-            for idx, line in enumerate(page1_lines):
-                if hebrew_pattern.search(line):
-                    match_line_idx = idx
-                    break
+            match_line_idx = _find_match_line(_HEBREW_TITLE_RE, page1_text, line_ends, hebrew_match)
             
             subject = None
             if match_line_idx is not None:
                 for idx in range(match_line_idx + 1, min(match_line_idx + 5, len(page1_lines))):
                     line_text = page1_lines[idx].strip()
-                    if re.match(r'^[א-ת\s]{4,30}$', line_text) and len(line_text.split()) <= 4:
+                    if _is_hebrew_subject(line_text):
                         if len(line_text) > 3 and not line_text.isdigit():
                             subject = line_text
                             break
@@ -131,20 +398,16 @@ class BaselineExtractor:
                 hebrew_title = f"תקן חשבונאות בינלאומי {standard_number}"
         
         # Extract English title
-        english_pattern = re.compile(r'International\s+Accounting\s+Standard\s+(\d+)', re.IGNORECASE)
         english_title = None
         
-        english_match = english_pattern.search(page1_text)
+        # The English pattern is case-insensitive, so prefilter on lower-cased text
+        english_match = _ENGLISH_TITLE_RE.search(page1_text) if "accounting" in page1_text.lower() else None
         if english_match:
             if not standard_number:
                 standard_number = english_match.group(1)
             
             # Find the line with "International Accounting Standard"
-            match_line_idx = None
-            for idx, line in enumerate(page1_lines):
-                if english_pattern.search(line):
-                    match_line_idx = idx
-                    break
+            match_line_idx = _find_match_line(_ENGLISH_TITLE_RE, page1_text, line_ends, english_match)
             
             if match_line_idx is not None:
                 # Collect subsequent title lines (title-case phrases)
@@ -157,23 +420,21 @@ class BaselineExtractor:
                     
                     # Match title-case phrases (e.g., "Property, Plant and Equipment")
                     # Can be comma-separated or multi-word
-                    if re.match(r'^[A-Z][a-z]+(?:\s+[a-z]+)*(?:\s*,\s*[A-Z][a-z]+(?:\s+[a-z]+)*)*$', line_text):
-                        skip_words = ["International", "Accounting", "Standard", "Financial", "Reporting"]
-                        if not any(word in line_text for word in skip_words):
+                    if _TITLE_PHRASE_RE.match(line_text):
+                        if not _TITLE_SKIP_WORD_RE.search(line_text):
                             subject_parts.append(line_text)
                             # Stop if we hit something that looks like end of title (e.g., numbers, dates, or Hebrew)
-                            if re.search(r'\d{4}|\d{1,2}/\d{1,2}', line_text) or re.search(r'[א-ת]', line_text):
+                            if _TITLE_END_RE.search(line_text) or _HEBREW_CHAR_RE.search(line_text):
                                 break
                     # Also accept single capitalized words that aren't skip words
-                    elif re.match(r'^[A-Z][a-z]{3,}$', line_text):
-                        skip_words = ["International", "Accounting", "Standard", "Financial", "Reporting", "The"]
-                        if line_text not in skip_words and not re.search(r'[א-ת]', line_text):
+                    elif _SINGLE_CAP_RE.match(line_text):
+                        if line_text not in _TITLE_SKIP_WORDS and not _HEBREW_CHAR_RE.search(line_text):
                             subject_parts.append(line_text)
                 
                 if subject_parts:
                     # Join parts, handling commas properly
                     english_title = " ".join(subject_parts)
-                    english_title = re.sub(r'\s*,\s*', ', ', english_title)
+                    english_title = _COMMA_RE.sub(', ', english_title)
             
             if not english_title and standard_number:
                 english_title = f"International Accounting Standard {standard_number}"
@@ -183,210 +444,6 @@ class BaselineExtractor:
             "english": english_title
         }
     
-    def _extract_paragraph_candidates(self, page_texts: Dict[int, List[str]], toc_pages: Set[int], standard_id: str) -> List[Dict[str, Any]]:
-        """Extract paragraph candidates from non-TOC pages.
-        
-        Args:
-            page_texts: Dictionary mapping page numbers to lists of lines
-            toc_pages: Set of TOC page numbers
-            standard_id: Standard ID (e.g., "IAS_16")
-            
-        Returns:
-            List of paragraph candidate dictionaries
-        """
-        candidates = []
-        
-        # Primary pattern: Number-dot with optional Hebrew suffix: "5.", "81.", "81א." (dot comes AFTER number/letters)
-        # This is the correct format per user specification: NUMBER. or NUMBERLETTER.
-        # Handle both "17." and "17 ." formats (space before/after dot is optional)
-        pattern_number_dot_hebrew = re.compile(r'^(\d{1,3})([א-ת]{1,3})?\s*\.\s*')
-        
-        # Fallback pattern 1: Dot-number pattern: ".1 " or ".16 " (for other PDF formats)
-        pattern_dot_number = re.compile(r'^\.(\d{1,3})([א-ת]{1,3})?\s+')
-        
-        # Fallback pattern 2: Plain number at start: "1 " or "16 " (for formats without dots)
-        pattern_plain_number = re.compile(r'^(\d{1,3})([א-ת]{1,3})?\s+')
-        
-        # Import hebrew_to_latin mapping
-        from pdf2json.extractor import hebrew_to_latin
-        
-        for page_num, lines in page_texts.items():
-            # Skip TOC pages
-            if page_num in toc_pages:
-                # #region agent log
-                import json; log_file = open('.cursor/debug.log', 'a', encoding='utf-8'); log_file.write(json.dumps({"sessionId": "debug-baseline", "runId": "run1", "hypothesisId": "C", "location": f"baseline.py:201", "message": "Skipping TOC page", "data": {"page": page_num}, "timestamp": __import__("time").time() * 1000}) + "\n"); log_file.close()
-                # #endregion
-                continue
-            
-            # #region agent log
-            import json; log_file = open('.cursor/debug.log', 'a', encoding='utf-8'); log_file.write(json.dumps({"sessionId": "debug-baseline", "runId": "run1", "hypothesisId": "E", "location": f"baseline.py:205", "message": "Processing non-TOC page", "data": {"page": page_num, "line_count": len(lines), "sample_lines": lines[:10] if lines else []}, "timestamp": __import__("time").time() * 1000}) + "\n"); log_file.close()
-            # #endregion
-            
-            # Process each line on this page
-            for line_idx, line_text in enumerate(lines):
-                line_text = line_text.strip()
-                if not line_text:
-                    continue
-                
-                matched = False
-                number = None
-                suffix = None
-                suffix_display = None
-                regex_name = None
-                
-                # Check for number-dot on separate lines: "22" followed by "." on next line
-                # This handles cases where paragraph number and dot are split across lines
-                if line_idx + 1 < len(lines):
-                    next_line = lines[line_idx + 1].strip()
-                    # Pattern: current line is just a number (possibly with Hebrew suffix), next line is just "."
-                    number_only_pattern = re.compile(r'^(\d{1,3})([א-ת]{1,3})?$')
-                    match_number_only = number_only_pattern.match(line_text)
-                    if match_number_only and next_line == '.':
-                        number = match_number_only.group(1)
-                        suffix_hebrew = match_number_only.group(2) if match_number_only.lastindex >= 2 and match_number_only.group(2) else None
-                        # Check if line after "." has content
-                        content_line_idx = line_idx + 2
-                        has_content = False
-                        if content_line_idx < len(lines):
-                            content_line = lines[content_line_idx].strip()
-                            has_content = bool(content_line and len(content_line) > 2)
-                        
-                        if has_content:
-                            if suffix_hebrew:
-                                if len(suffix_hebrew) == 1:
-                                    suffix = hebrew_to_latin(suffix_hebrew)
-                                else:
-                                    suffix = "".join(hebrew_to_latin(c) for c in suffix_hebrew)
-                                suffix_display = suffix_hebrew
-                            else:
-                                suffix = None
-                                suffix_display = None
-                            regex_name = "number-dot-separate"
-                            matched = True
-                
-                # PRIMARY PATTERN: Number-dot with optional Hebrew suffix: "5.", "81.", "81א.", "17 ."
-                # Format: NUMBER. or NUMBERLETTER. (dot comes AFTER number/letters)
-                # Handle both "17." and "17 ." formats (space before dot is optional)
-                # Paragraph number may be on its own line (followed by content on next line) or on same line as content
-                if not matched:
-                    match_primary = pattern_number_dot_hebrew.match(line_text)
-                if match_primary:
-                    # Check if there's content after the paragraph marker on the same line
-                    rest = line_text[match_primary.end():].strip()
-                    # Also check if next line has content (paragraph number on its own line)
-                    next_line_has_content = False
-                    if line_idx + 1 < len(lines):
-                        next_line = lines[line_idx + 1].strip()
-                        next_line_has_content = bool(next_line and len(next_line) > 2)
-                    
-                    # Accept if content on same line OR next line has content (even if short)
-                    # Be lenient - accept if next line exists and is not empty
-                    if (rest and len(rest) > 2) or (line_idx + 1 < len(lines) and lines[line_idx + 1].strip()):
-                        number = match_primary.group(1)
-                        suffix_hebrew = match_primary.group(2) if match_primary.lastindex >= 2 and match_primary.group(2) else None
-                        if suffix_hebrew:
-                            # Handle multi-letter Hebrew (e.g., "יד" -> "ID")
-                            if len(suffix_hebrew) == 1:
-                                suffix = hebrew_to_latin(suffix_hebrew)
-                            else:
-                                suffix = "".join(hebrew_to_latin(c) for c in suffix_hebrew)
-                            suffix_display = suffix_hebrew
-                        else:
-                            suffix = None
-                            suffix_display = None
-                        regex_name = "number-dot"
-                        matched = True
-                
-                # FALLBACK PATTERN 1: Dot-number pattern: ".1 ", ".16 ", ".81א " (for other PDF formats)
-                if not matched:
-                    match_dot = pattern_dot_number.match(line_text)
-                    if match_dot:
-                        rest = line_text[match_dot.end():].strip()
-                        if rest and len(rest) > 2:
-                            number = match_dot.group(1)
-                            suffix_hebrew = match_dot.group(2) if match_dot.lastindex >= 2 and match_dot.group(2) else None
-                            if suffix_hebrew:
-                                if len(suffix_hebrew) == 1:
-                                    suffix = hebrew_to_latin(suffix_hebrew)
-                                else:
-                                    suffix = "".join(hebrew_to_latin(c) for c in suffix_hebrew)
-                                suffix_display = suffix_hebrew
-                            else:
-                                suffix = None
-                                suffix_display = None
-                            regex_name = "dot-number"
-                            matched = True
-                
-                # FALLBACK PATTERN 2: Plain number: "1 ", "16 ", "81א " (for formats without dots)
-                if not matched:
-                    match_plain = pattern_plain_number.match(line_text)
-                    if match_plain:
-                        rest = line_text[match_plain.end():].strip()
-                        # Only use if has meaningful content
-                        if rest and len(rest) > 5:
-                            number = match_plain.group(1)
-                            suffix_hebrew = match_plain.group(2) if match_plain.lastindex >= 2 and match_plain.group(2) else None
-                            if suffix_hebrew:
-                                if len(suffix_hebrew) == 1:
-                                    suffix = hebrew_to_latin(suffix_hebrew)
-                                else:
-                                    suffix = "".join(hebrew_to_latin(c) for c in suffix_hebrew)
-                                suffix_display = suffix_hebrew
-                            else:
-                                suffix = None
-                                suffix_display = None
-                            regex_name = "plain-number"
-                            matched = True
-                
-                if matched and number:
-                    # Build token_raw (display version)
-                    token_raw = number
-                    if suffix_display:
-                        token_raw += suffix_display
-                    
-                    # Build canonical token
-                    if suffix:
-                        token = f"{standard_id}:{number}{suffix}"
-                    else:
-                        token = f"{standard_id}:{number}"
-                    
-                    # Build snippet: matched_line + next_line if available
-                    matched_line = line_text
-                    snippet = matched_line
-                    
-                    # Always try to add next line if available (paragraph number may be on its own line)
-                    if line_idx + 1 < len(lines):
-                        next_line = lines[line_idx + 1].strip()
-                        if next_line:
-                            # If matched_line is just the paragraph number (e.g., "1."), use next line as snippet
-                            if len(matched_line.strip()) <= 5:  # Just "1." or "81א."
-                                snippet = next_line[:80]
-                            else:
-                                snippet = matched_line + " " + next_line[:80]
-                    
-                    # Ensure snippet is not empty (use matched_line if needed)
-                    if not snippet.strip():
-                        snippet = matched_line[:80] if matched_line else ""
-                    
-                    # #region agent log
-                    import json; log_file = open('.cursor/debug.log', 'a', encoding='utf-8'); log_file.write(json.dumps({"sessionId": "debug-baseline", "runId": "run2", "hypothesisId": "ALL", "location": f"baseline.py:285", "message": "Candidate added", "data": {"page": page_num, "token": token, "token_raw": token_raw, "regex_name": regex_name}, "timestamp": __import__("time").time() * 1000}) + "\n"); log_file.close()
-                    # #endregion
-                    
-                    candidates.append({
-                        "page": page_num,
-                        "token": token,
-                        "token_raw": token_raw,
-                        "matched_line": matched_line,
-                        "snippet": snippet,
-                        "regex_name": regex_name
-                    })
-        
-        # #region agent log
-        import json; log_file = open('.cursor/debug.log', 'a', encoding='utf-8'); log_file.write(json.dumps({"sessionId": "debug-baseline", "runId": "run1", "hypothesisId": "ALL", "location": "baseline.py:275", "message": "Paragraph candidates extraction complete", "data": {"total_candidates": len(candidates), "candidates_by_page": {p: sum(1 for c in candidates if c["page"] == p) for p in set(c["page"] for c in candidates)}}, "timestamp": __import__("time").time() * 1000}) + "\n"); log_file.close()
-        # #endregion
-        
-        return candidates
-    
     def _validate_baseline(self, baseline: Dict[str, Any], standard_id: str) -> Tuple[bool, List[str]]:
         """Validate baseline quality.
         
@@ -405,22 +462,30 @@ class BaselineExtractor:
         if len(candidates) < min_required:
             reasons.append(f"Paragraph count {len(candidates)} < {min_required}")
         
+        # One pass over the candidates feeds checks 2 and 3
+        non_empty_snippets = 0
+        page4_candidates = []
+        for c in candidates:
+            if c.get("snippet", "").strip():
+                non_empty_snippets += 1
+            if c.get("page") == 4:
+                page4_candidates.append(c)
+        
         # Check 2: >= 90% of candidates must have non-empty snippet
         if candidates:
-            non_empty_snippets = sum(1 for c in candidates if c.get("snippet", "").strip())
             snippet_ratio = non_empty_snippets / len(candidates)
             if snippet_ratio < 0.90:
                 reasons.append(f"Only {snippet_ratio:.1%} of candidates have non-empty snippets (required >= 90%)")
         
         # Check 3: For IAS_16, page 4 must include tokens ".1" and ".2" with non-empty snippets
         if standard_id == "IAS_16":
-            page4_candidates = [c for c in candidates if c.get("page") == 4]
-            page4_tokens = {c.get("token_raw", "") for c in page4_candidates}
-            has_1 = any("1" in token and token.strip() in ("1", ".1") for token in page4_tokens)
-            has_2 = any("2" in token and token.strip() in ("2", ".2") for token in page4_tokens)
+            # Raw (display) and canonical tokens collected once for O(1) membership tests
+            page4_tokens = {c.get("token_raw", "").strip() for c in page4_candidates}
+            page4_tokens_canonical = {c.get("token", "") for c in page4_candidates}
+            has_1 = "1" in page4_tokens or ".1" in page4_tokens
+            has_2 = "2" in page4_tokens or ".2" in page4_tokens
             
             # More flexible check: look for tokens that map to "1" and "2" (e.g., IAS_16:1, IAS_16:2)
-            page4_tokens_canonical = {c.get("token", "") for c in page4_candidates}
             has_1_canonical = f"{standard_id}:1" in page4_tokens_canonical
             has_2_canonical = f"{standard_id}:2" in page4_tokens_canonical
             
@@ -429,14 +494,14 @@ class BaselineExtractor:
             if not (has_2_canonical or has_2):
                 reasons.append(f"Page 4 missing token '.2' or '{standard_id}:2'")
             
-            # Also check snippets are non-empty for these tokens
+            # Also check snippets are non-empty for these tokens (first matching candidate only)
             if has_1_canonical or has_1:
-                token_1_candidates = [c for c in page4_candidates if "1" in c.get("token_raw", "") or c.get("token", "").endswith(":1")]
-                if token_1_candidates and not token_1_candidates[0].get("snippet", "").strip():
+                token_1_candidate = next((c for c in page4_candidates if "1" in c.get("token_raw", "") or c.get("token", "").endswith(":1")), None)
+                if token_1_candidate and not token_1_candidate.get("snippet", "").strip():
                     reasons.append("Page 4 token '.1' has empty snippet")
             if has_2_canonical or has_2:
-                token_2_candidates = [c for c in page4_candidates if "2" in c.get("token_raw", "") or c.get("token", "").endswith(":2")]
-                if token_2_candidates and not token_2_candidates[0].get("snippet", "").strip():
+                token_2_candidate = next((c for c in page4_candidates if "2" in c.get("token_raw", "") or c.get("token", "").endswith(":2")), None)
+                if token_2_candidate and not token_2_candidate.get("snippet", "").strip():
                     reasons.append("Page 4 token '.2' has empty snippet")
         
         # Check 4: English title must have at least 2 words (if present)
@@ -1,16 +1,16 @@
 """CLI commands using Typer."""
 
+import re
 import sys
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 import typer
-from pdf2json.parser import PDFTextExtractor
-from pdf2json.extractor import Extractor
-from pdf2json.qa import QAValidator
-from pdf2json.output import OutputGenerator
 
 app = typer.Typer(help="IFRS PDF to JSON Converter")
 
+_STANDARD_ID_RE = re.compile(r'(IAS|IFRS)[_\s]*(\d+)', re.IGNORECASE)
+_DIGIT_RE = re.compile(r'\d+')
+
 
 def extract_standard_id(pdf_path: str) -> str:
     """Extract standard ID from PDF filename.
@@ -23,14 +23,39 @@ def extract_standard_id(pdf_path: str) -> str:
     """
     filename = Path(pdf_path).stem
     # Try to extract IAS_16, IFRS_15, etc. from filename
-    import re
-    match = re.search(r'(IAS|IFRS)[_\s]*(\d+)', filename, re.IGNORECASE)
+    match = _STANDARD_ID_RE.search(filename)
     if match:
         return f"{match.group(1).upper()}_{match.group(2)}"
     # Fallback: use filename
     return filename.replace(" ", "_").replace("-", "_")
 
 
+def _validate_pdf_path(pdf_path: str) -> None:
+    """Exit with code 1 unless pdf_path names an existing .pdf file.
+    
+    Args:
+        pdf_path: Path to PDF file as given on the command line
+    """
+    pdf_file = Path(pdf_path)
+    if not pdf_file.exists():
+        typer.echo(f"Error: PDF file not found: {pdf_path}", err=True)
+        raise typer.Exit(code=1)
+    
+    if not pdf_file.suffix.lower() == ".pdf":
+        typer.echo(f"Error: Not a PDF file: {pdf_path}", err=True)
+        raise typer.Exit(code=1)
+
+
+def _echo_bullets(items: List[str]) -> None:
+    """Echo items as an indented bullet list in a single write.
+    
+    Args:
+        items: Lines to print, one bullet each
+    """
+    if items:
+        typer.echo("\n".join(f"  - {item}" for item in items))
+
+
 @app.command()
 def fix(
     pdf_path: str = typer.Argument(..., help="Path to the PDF file"),
@@ -46,18 +71,17 @@ def fix(
     4. If QA passes: outputs JSON files and HTML report, exits with code 0
     5. If QA fails: outputs best candidate + HTML report, exits with non-zero code
     """
-    # Validate PDF path
-    pdf_file = Path(pdf_path)
-    if not pdf_file.exists():
-        typer.echo(f"Error: PDF file not found: {pdf_path}", err=True)
-        raise typer.Exit(code=1)
+    _validate_pdf_path(pdf_path)
     
-    if not pdf_file.suffix.lower() == ".pdf":
-        typer.echo(f"Error: Not a PDF file: {pdf_path}", err=True)
-        raise typer.Exit(code=1)
+    # PDF and parsing modules load PyMuPDF; import them per command so that
+    # `version` and `--help` stay fast
+    from pdf2json.parser import PDFTextExtractor
+    from pdf2json.extractor import Extractor
+    from pdf2json.qa import QAValidator
+    from pdf2json.output import OutputGenerator
     
     # Extract standard ID
-    standard_id = extract_standard_id(str(pdf_path))
+    standard_id = extract_standard_id(pdf_path)
     typer.echo(f"Processing {standard_id} from {pdf_path}")
     
     # Initialize components
@@ -68,18 +92,22 @@ def fix(
     best_document = None
     best_qa = None
     best_confidence = 0.0
+    baseline_text: Optional[str] = None
     
     # Step 1: Baseline extraction
     typer.echo("Step 1: Extracting baseline text...")
     try:
-        with PDFTextExtractor(str(pdf_path)) as pdf_extractor:
+        with PDFTextExtractor(pdf_path) as pdf_extractor:
             baseline_text = pdf_extractor.extract_baseline_text()
             typer.echo(f"[OK] Extracted {len(baseline_text)} characters")
             
             # Step 2 & 3: Try parsing strategies in loop until QA passes
             typer.echo("\nStep 2: Parsing structure...")
             
-            # Try each strategy until one passes QA
+            # Try each strategy until one passes QA. Strategies run in order on
+            # the shared open document; a worker pool would have to reopen and
+            # re-decode the PDF per strategy, which costs more than it saves
+            # while only SimpleStrategy is registered.
             for strategy_num, strategy in enumerate(extractor.strategies, 1):
                 typer.echo(f"  Trying strategy {strategy_num}...")
                 try:
@@ -87,6 +115,8 @@ def fix(
                     typer.echo(f"  [OK] Parsed with confidence: {confidence:.2%}")
                     
                     typer.echo(f"\nStep 3: Running QA validation...")
+                    # Always validate: confidence is a paragraph-count heuristic, not a
+                    # bound on the QA score, so it cannot safely rule a candidate out
                     qa_result = validator.validate(document, baseline_text)
                     
                     # Track best result (prefer higher QA score, then higher confidence)
@@ -99,7 +129,8 @@ def fix(
                     if qa_result.passed:
                         typer.echo(f"[PASS] QA passed! Score: {qa_result.score:.2%}")
                         
-                        # Generate output files
+                        # Generate output files (about a millisecond in total, so they
+                        # are written in order; a thread pool measured slower)
                         typer.echo("\nGenerating output files...")
                         json_path = output_gen.generate_main_json(document)
                         qa_path = output_gen.generate_qa_json(qa_result)
@@ -136,14 +167,8 @@ def fix(
     typer.echo(f"Outputting best candidate (confidence: {best_confidence:.2%}, QA score: {best_qa.score:.2%})...")
     json_path = output_gen.generate_main_json(best_document)
     qa_path = output_gen.generate_qa_json(best_qa) if best_qa else None
-    # Get baseline text for HTML report
-    baseline_text_for_report = None
-    try:
-        with PDFTextExtractor(str(pdf_path)) as pdf_extractor:
-            baseline_text_for_report = pdf_extractor.extract_baseline_text()
-    except:
-        pass
-    html_path = output_gen.generate_html_report(best_document, best_qa, baseline_text_for_report)
+    # Reuse the baseline text extracted in step 1 for the HTML report
+    html_path = output_gen.generate_html_report(best_document, best_qa, baseline_text)
     
     typer.echo(f"Main JSON: {json_path}")
     if qa_path:
@@ -159,6 +184,7 @@ def debug(
     pdf_path: str = typer.Argument(..., help="Path to the PDF file"),
     out: str = typer.Option("out", "--out", "-o", help="Output directory"),
     golden: bool = typer.Option(False, "--golden", help="Run in golden mode (stricter QA)"),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Print a full traceback on errors"),
 ):
     """Generate debug artifacts for parsing diagnostics.
     
@@ -168,24 +194,17 @@ def debug(
     3. Creates diff artifacts (coverage, missing IDs, extra IDs, first failure)
     4. Outputs baseline.json, detected.json, diff.json, and debug.html
     """
-    import json
-    import re
-    from pathlib import Path
+    _validate_pdf_path(pdf_path)
+    
+    from pdf2json.parser import PDFTextExtractor
+    from pdf2json.extractor import Extractor
+    from pdf2json.qa import QAValidator
+    from pdf2json.output import OutputGenerator, write_json_file, write_text_file
     from pdf2json.baseline import BaselineExtractor
     from pdf2json.debug_diff import create_diff, write_debug_files
     
-    # Validate PDF path
-    pdf_file = Path(pdf_path)
-    if not pdf_file.exists():
-        typer.echo(f"Error: PDF file not found: {pdf_path}", err=True)
-        raise typer.Exit(code=1)
-    
-    if not pdf_file.suffix.lower() == ".pdf":
-        typer.echo(f"Error: Not a PDF file: {pdf_path}", err=True)
-        raise typer.Exit(code=1)
-    
     # Extract standard ID
-    standard_id = extract_standard_id(str(pdf_path))
+    standard_id = extract_standard_id(pdf_path)
     typer.echo(f"Debug mode: Processing {standard_id} from {pdf_path}")
     
     # Initialize components
@@ -194,7 +213,7 @@ def debug(
     extractor = Extractor()
     
     try:
-        with PDFTextExtractor(str(pdf_path)) as pdf_extractor:
+        with PDFTextExtractor(pdf_path) as pdf_extractor:
             typer.echo("\nStep 1: Extracting baseline...")
             baseline_extractor = BaselineExtractor(pdf_extractor)
             baseline = baseline_extractor.extract_baseline(standard_id)
@@ -206,8 +225,7 @@ def debug(
             # Check baseline validity
             if not baseline_valid:
                 typer.echo(f"\n✗ BASELINE_INVALID: Baseline validation failed")
-                for reason in validation_reasons:
-                    typer.echo(f"  - {reason}")
+                _echo_bullets(validation_reasons)
                 
                 # Still write files but with invalid baseline
                 detected_ids = []  # Empty since we didn't parse
@@ -223,7 +241,7 @@ def debug(
                     "missing_ids": [],
                     "extra_ids": [],
                     "first_failure": None,
-                    "toc_pages": sorted(list(baseline.get("toc_pages", [])))
+                    "toc_pages": sorted(baseline.get("toc_pages", []))
                 }
                 
                 # For invalid baseline, we can't write detected.json properly without document
@@ -234,13 +252,11 @@ def debug(
                 
                 # Write baseline.json
                 baseline_path = output_dir / f"{standard_id}.baseline.json"
-                with open(baseline_path, 'w', encoding='utf-8') as f:
-                    json.dump(baseline, f, ensure_ascii=False, indent=2)
+                write_json_file(baseline_path, baseline)
                 
                 # Write diff.json
                 diff_path = output_dir / f"{standard_id}.diff.json"
-                with open(diff_path, 'w', encoding='utf-8') as f:
-                    json.dump(diff, f, ensure_ascii=False, indent=2)
+                write_json_file(diff_path, diff)
                 
                 # Write debug.html (without document, we'll pass None and handle it)
                 html_path = output_dir / f"{standard_id}.debug.html"
@@ -253,8 +269,7 @@ def debug(
                     main=MainContent(sections=[])
                 )
                 html_content = _generate_debug_html(standard_id, baseline, [], diff, empty_doc)
-                with open(html_path, 'w', encoding='utf-8') as f:
-                    f.write(html_content)
+                write_text_file(html_path, html_content)
                 
                 typer.echo(f"[OK] Debug files written to {out}/")
                 typer.echo("\n⚠ Baseline is invalid. Cannot proceed with parsing/diff. Please fix baseline extraction.")
@@ -263,13 +278,16 @@ def debug(
             typer.echo("[OK] Baseline validation passed")
             
             typer.echo("\nStep 2: Running parser...")
-            # Run parser using the first strategy
+            # Run parser using the first strategy. It runs after the baseline
+            # rather than alongside it: an invalid baseline skips parsing, and
+            # PyMuPDF holds the GIL, so a second thread only adds overhead.
             strategy = extractor.strategies[0]
             document, confidence = strategy.parse(pdf_extractor, standard_id)
             typer.echo(f"[OK] Parsed with confidence: {confidence:.2%}")
             
-            # Extract detected paragraph IDs
-            detected_ids = _extract_detected_paragraph_ids(document)
+            # Flatten the paragraph tree once; detected IDs and golden QA share it
+            paragraphs = list(document.iter_paragraphs())
+            detected_ids = _extract_detected_paragraph_ids(paragraphs)
             
             typer.echo("\nStep 3: Creating diff...")
             diff = create_diff(baseline, detected_ids, document, standard_id)
@@ -283,14 +301,17 @@ def debug(
             # Print summary
             first_missing = diff.get("first_failure")
             first_missing_id = first_missing.get("token") if first_missing else None
-            typer.echo(f"\nSummary:")
-            typer.echo(f"  baseline_valid: {baseline_valid}")
-            typer.echo(f"  baseline_count: {diff.get('baseline_count', 0)}")
-            typer.echo(f"  detected_count: {diff.get('detected_count', 0)}")
+            summary = [
+                "\nSummary:",
+                f"  baseline_valid: {baseline_valid}",
+                f"  baseline_count: {diff.get('baseline_count', 0)}",
+                f"  detected_count: {diff.get('detected_count', 0)}",
+            ]
             if diff.get("baseline_valid"):
-                typer.echo(f"  coverage: {diff.get('coverage', 0):.2%}")
-            typer.echo(f"  first_missing_id: {first_missing_id or 'None'}")
-            typer.echo(f"  toc_pages: {diff.get('toc_pages', [])}")
+                summary.append(f"  coverage: {diff.get('coverage', 0):.2%}")
+            summary.append(f"  first_missing_id: {first_missing_id or 'None'}")
+            summary.append(f"  toc_pages: {diff.get('toc_pages', [])}")
+            typer.echo("\n".join(summary))
             
             # Golden mode checks
             golden_failures = []
@@ -307,13 +328,12 @@ def debug(
                 # Check title completeness
                 if not document.standard_title or not document.standard_title.hebrew:
                     golden_failures.append("Hebrew title missing")
-                elif not re.search(r'\d+', document.standard_title.hebrew):
+                elif not _DIGIT_RE.search(document.standard_title.hebrew):
                     golden_failures.append("Hebrew title missing standard number")
                 
                 if golden_failures:
                     typer.echo(f"\n⚠ Golden mode FAILURES:")
-                    for failure in golden_failures:
-                        typer.echo(f"  - {failure}")
+                    _echo_bullets(golden_failures)
             
             typer.echo("\nStep 4: Writing debug files...")
             write_debug_files(output_gen, standard_id, baseline, detected_ids, diff, document)
@@ -323,69 +343,47 @@ def debug(
             if golden and diff.get("baseline_valid"):
                 typer.echo("\nStep 5: Running QA validation (golden mode)...")
                 baseline_text = pdf_extractor.extract_baseline_text()
-                qa_result = validator.validate(document, baseline_text)
+                qa_result = validator.validate(document, baseline_text, paragraphs)
                 typer.echo(f"[OK] QA Score: {qa_result.score:.2%}")
                 if not qa_result.passed:
                     typer.echo(f"⚠ QA failed: {len(qa_result.issues)} issues")
-                    for issue in qa_result.issues:
-                        typer.echo(f"  - {issue}")
+                    _echo_bullets(qa_result.issues)
                     if golden_failures:
                         raise typer.Exit(code=1)
             
+    except typer.Exit:
+        # Re-raise typer.Exit to preserve exit code
+        raise
     except Exception as e:
         typer.echo(f"Error during debug: {e}", err=True)
-        import traceback
-        traceback.print_exc()
+        if verbose:
+            import traceback
+            traceback.print_exc()
         raise typer.Exit(code=1)
 
 
-def _extract_detected_paragraph_ids(document) -> List[Dict[str, Any]]:
-    """Extract detected paragraph IDs from document.
+def _extract_detected_paragraph_ids(paragraphs) -> List[Dict[str, Any]]:
+    """Extract detected paragraph IDs from a document's paragraphs.
     
-    Returns:
-        List of dictionaries with paragraph_id, page (if available), and snippet
-    """
-    detected = []
-    
-    # Extract from main content
-    for section in document.main.sections:
-        for para in section.paragraphs:
-            detected.append({
-                "paragraph_id": para.paragraph_id,
-                "paragraph_id_display": para.paragraph_id_display,
-                "snippet": para.content[:80] if para.content else "",
-                "source": "main"
-            })
-        for sub in section.subsections:
-            for para in sub.paragraphs:
-                detected.append({
-                    "paragraph_id": para.paragraph_id,
-                    "paragraph_id_display": para.paragraph_id_display,
-                    "snippet": para.content[:80] if para.content else "",
-                    "source": "main"
-                })
+    The records are plain dicts because they are written as-is to
+    detected.json and into the extra_ids of diff.json.
     
-    # Extract from appendices
-    for appendix in [document.appendix_A, document.appendix_B, document.appendix_C]:
-        if appendix:
-            for section in appendix.sections:
-                for para in section.paragraphs:
-                    detected.append({
-                        "paragraph_id": para.paragraph_id,
-                        "paragraph_id_display": para.paragraph_id_display,
-                        "snippet": para.content[:80] if para.content else "",
-                        "source": f"appendix_{appendix.appendix_id}"
-                    })
-                for sub in section.subsections:
-                    for para in sub.paragraphs:
-                        detected.append({
-                            "paragraph_id": para.paragraph_id,
-                            "paragraph_id_display": para.paragraph_id_display,
-                            "snippet": para.content[:80] if para.content else "",
-                            "source": f"appendix_{appendix.appendix_id}"
-                        })
+    Args:
+        paragraphs: (paragraph, source) pairs from StandardDocument.iter_paragraphs()
     
-    return detected
+    Returns:
+        List of dictionaries with paragraph_id, paragraph_id_display,
+        snippet (first 80 characters) and source ("main" or "appendix_<id>")
+    """
+    return [
+        {
+            "paragraph_id": para.paragraph_id,
+            "paragraph_id_display": para.paragraph_id_display,
+            "snippet": para.content[:80] if para.content else "",
+            "source": source
+        }
+        for para, source in paragraphs
+    ]
 
 
 @app.command()
@@ -1,10 +1,109 @@
 """Diff creation for debug pipeline."""
 
-from typing import List, Dict, Any, Set
+from typing import List, Dict, Any, Optional, Set, Tuple
+from html import escape
+from itertools import islice
 from pathlib import Path
-import json
 from pdf2json.models import StandardDocument
-from pdf2json.output import OutputGenerator
+from pdf2json.output import OutputGenerator, write_json_file, write_text_file
+
+# Rows shown per missing/extra table in the debug report
+_MAX_REPORT_ROWS = 50
+
+_MISSING_ROW_TMPL = """        <tr class="missing">
+            <td>{token}</td>
+            <td>{page}</td>
+            <td>{snippet}</td>
+            <td>{pattern}</td>
+        </tr>
+"""
+
+_EXTRA_ROW_TMPL = """        <tr class="extra">
+            <td>{paragraph_id}</td>
+            <td>{source}</td>
+            <td>{snippet}</td>
+        </tr>
+"""
+
+# Report head, styles and page heading up to the validation section; the
+# CSS braces are doubled for str.format
+_DEBUG_HTML_HEAD_TMPL = """<!DOCTYPE html>
+<html dir="rtl" lang="he">
+<head>
+    <meta charset="UTF-8">
+    <title>Debug Report: {standard_id}</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; margin: 20px; }}
+        h1, h2 {{ color: #333; }}
+        .metric {{ margin: 10px 0; padding: 10px; background: #f5f5f5; border-radius: 5px; }}
+        .coverage {{ font-size: 24px; font-weight: bold; }}
+        .good {{ color: green; }}
+        .warning {{ color: orange; }}
+        .error {{ color: red; }}
+        .invalid {{ background-color: #ffcccc; padding: 15px; border: 2px solid red; }}
+        table {{ border-collapse: collapse; width: 100%; margin: 20px 0; }}
+        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: right; }}
+        th {{ background-color: #4CAF50; color: white; }}
+        .missing {{ background-color: #ffcccc; }}
+        .extra {{ background-color: #ffffcc; }}
+        pre {{ background: #f5f5f5; padding: 10px; overflow-x: auto; }}
+    </style>
+</head>
+<body>
+    <h1>Debug Report: {standard_id}</h1>
+    
+    <h2>Baseline Validation</h2>
+"""
+
+_DEBUG_HTML_TAIL = """
+</body>
+</html>"""
+
+
+def _escape(value: Any) -> str:
+    """HTML-escape a value for the debug report (quotes included)."""
+    return escape(str(value))
+
+
+def _scan_detected(detected_ids: List[Dict[str, Any]],
+                   baseline_tokens: Optional[Set[str]] = None) -> Tuple[Set[str], Dict[str, int], int, List[Dict[str, Any]]]:
+    """Collect the detected-ID statistics needed for a diff in one pass.
+    
+    Args:
+        detected_ids: List of detected paragraph ID dictionaries
+        baseline_tokens: Baseline tokens; when given, detections outside
+            this set are returned as extra IDs
+        
+    Returns:
+        Tuple of (detected_tokens, extracted_counts, body_paragraph_count, extra_ids)
+    """
+    detected_tokens: Set[str] = set()
+    extracted_counts = {"main": 0, "appendix_A": 0, "appendix_B": 0, "appendix_C": 0}
+    body_paragraph_count = 0
+    extra_ids = []
+    
+    for item in detected_ids:
+        paragraph_id = item["paragraph_id"]
+        detected_tokens.add(paragraph_id)
+        
+        if item.get("source") == "main":
+            body_paragraph_count += 1
+        
+        # Count paragraphs per part (other sources are not reported)
+        source = item.get("source", "main")
+        if source in extracted_counts:
+            extracted_counts[source] += 1
+        
+        # Find extra IDs (detected - baseline)
+        if baseline_tokens is not None and paragraph_id not in baseline_tokens:
+            extra_ids.append({
+                "paragraph_id": paragraph_id,
+                "paragraph_id_display": item.get("paragraph_id_display"),
+                "snippet": item.get("snippet", ""),
+                "source": item.get("source", "")
+            })
+    
+    return detected_tokens, extracted_counts, body_paragraph_count, extra_ids
 
 
 def create_diff(baseline: Dict[str, Any], detected_ids: List[Dict[str, Any]], document: StandardDocument, standard_id: str) -> Dict[str, Any]:
@@ -17,31 +116,35 @@ def create_diff(baseline: Dict[str, Any], detected_ids: List[Dict[str, Any]], do
         standard_id: Standard ID (e.g., "IAS_16")
         
     Returns:
-        Dictionary with coverage, missing_ids, extra_ids, and first_failure (or validation reasons if invalid)
+        Dictionary with coverage, missing_ids, extra_ids, and first_failure (or validation reasons if invalid).
+        Every missing/extra entry carries all of its keys, so readers can index them directly.
     """
     baseline_valid = baseline.get("baseline_valid", False)
     validation_reasons = baseline.get("baseline_validation_reasons", [])
+    toc_pages = sorted(set(baseline.get("toc_pages", ())))
     
     # If baseline is invalid, return early with validation reasons
     if not baseline_valid:
+        _, extracted_counts, body_paragraph_count, _ = _scan_detected(detected_ids)
         return {
             "baseline_valid": False,
             "validation_reasons": validation_reasons,
             "coverage": None,
             "baseline_count": len(baseline.get("paragraph_candidates", [])),
             "detected_count": len(detected_ids),
-            "body_paragraph_count": sum(1 for item in detected_ids if item.get("source") == "main"),
+            "body_paragraph_count": body_paragraph_count,
+            "extracted_counts": extracted_counts,
             "missing_ids": [],
             "extra_ids": [],
             "first_failure": None,
-            "toc_pages": sorted(list(baseline.get("toc_pages", [])))
+            "toc_pages": toc_pages
         }
     
     # Extract baseline paragraph IDs (tokens)
     baseline_tokens: Set[str] = {cand["token"] for cand in baseline["paragraph_candidates"]}
     
-    # Extract detected paragraph IDs
-    detected_tokens: Set[str] = {item["paragraph_id"] for item in detected_ids}
+    # Extract detected paragraph IDs, per-part counts and extras in one pass
+    detected_tokens, extracted_counts, body_paragraph_count, extra_ids = _scan_detected(detected_ids, baseline_tokens)
     
     # Calculate coverage
     baseline_count = len(baseline_tokens)
@@ -49,45 +152,21 @@ def create_diff(baseline: Dict[str, Any], detected_ids: List[Dict[str, Any]], do
     coverage = detected_count / baseline_count if baseline_count > 0 else 0.0
     
     # Find missing IDs (baseline - detected)
-    missing_tokens = baseline_tokens - detected_tokens
-    missing_ids = []
-    for cand in baseline["paragraph_candidates"]:
-        if cand["token"] in missing_tokens:
-            missing_ids.append({
-                "token": cand["token"],
-                "token_display": cand.get("token_raw"),
-                "page": cand["page"],
-                "snippet": cand.get("snippet", ""),
-                "pattern": cand.get("regex_name", "unknown")
-            })
-    
-    # Find extra IDs (detected - baseline)
-    extra_tokens = detected_tokens - baseline_tokens
-    extra_ids = []
-    for item in detected_ids:
-        if item["paragraph_id"] in extra_tokens:
-            extra_ids.append({
-                "paragraph_id": item["paragraph_id"],
-                "paragraph_id_display": item.get("paragraph_id_display"),
-                "snippet": item.get("snippet", ""),
-                "source": item.get("source", "")
-            })
-    
-    # Find first failure (first missing ID)
-    first_failure = None
-    if missing_ids:
-        # Sort by page, then by token to find the first one
-        sorted_missing = sorted(missing_ids, key=lambda x: (x["page"], x["token"]))
-        first_failure = sorted_missing[0]
-    
-    # Count body paragraphs (exclude appendices)
-    body_paragraph_count = sum(
-        1 for item in detected_ids
-        if item.get("source") == "main"
-    )
+    missing_ids = [
+        {
+            "token": cand["token"],
+            "token_display": cand.get("token_raw"),
+            "page": cand["page"],
+            "snippet": cand.get("snippet", ""),
+            "pattern": cand.get("regex_name", "unknown")
+        }
+        for cand in baseline["paragraph_candidates"]
+        if cand["token"] not in detected_tokens
+    ]
     
-    # Check TOC contamination
-    toc_pages = set(baseline["toc_pages"])
+    # Find first failure (first missing ID by page, then token); min() keeps
+    # the earliest of equal keys, as the stable sort it replaces did
+    first_failure = min(missing_ids, key=lambda x: (x["page"], x["token"]), default=None)
     
     return {
         "baseline_valid": True,
@@ -95,10 +174,11 @@ def create_diff(baseline: Dict[str, Any], detected_ids: List[Dict[str, Any]], do
         "baseline_count": baseline_count,
         "detected_count": detected_count,
         "body_paragraph_count": body_paragraph_count,
+        "extracted_counts": extracted_counts,
         "missing_ids": missing_ids,
         "extra_ids": extra_ids,
         "first_failure": first_failure,
-        "toc_pages": sorted(list(toc_pages))
+        "toc_pages": toc_pages
     }
 
 
@@ -117,26 +197,19 @@ def write_debug_files(output_gen: OutputGenerator, standard_id: str, baseline: D
     output_dir = Path(output_gen.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    # Write baseline.json
+    # Write baseline.json (JSON has no sets, so a set of TOC pages is written sorted)
+    if isinstance(baseline.get("toc_pages"), (set, frozenset)):
+        baseline = {**baseline, "toc_pages": sorted(baseline["toc_pages"])}
     baseline_path = output_dir / f"{standard_id}.baseline.json"
-    with open(baseline_path, 'w', encoding='utf-8') as f:
-        json.dump(baseline, f, ensure_ascii=False, indent=2)
+    write_json_file(baseline_path, baseline)
     
     # Write detected.json
     detected_path = output_dir / f"{standard_id}.detected.json"
     
-    # Count paragraphs per part
-    extracted_counts = {"main": 0, "appendix_A": 0, "appendix_B": 0, "appendix_C": 0}
-    for item in detected_ids:
-        source = item.get("source", "main")
-        if source == "main":
-            extracted_counts["main"] += 1
-        elif source == "appendix_A":
-            extracted_counts["appendix_A"] += 1
-        elif source == "appendix_B":
-            extracted_counts["appendix_B"] += 1
-        elif source == "appendix_C":
-            extracted_counts["appendix_C"] += 1
+    # Count paragraphs per part (create_diff already did; diffs built elsewhere may not have)
+    extracted_counts = diff.get("extracted_counts")
+    if extracted_counts is None:
+        _, extracted_counts, _, _ = _scan_detected(detected_ids)
     
     detected_data = {
         "extracted_title_hebrew": document.standard_title.hebrew if document.standard_title else None,
@@ -146,19 +219,16 @@ def write_debug_files(output_gen: OutputGenerator, standard_id: str, baseline: D
         "total_count": len(detected_ids),
         "body_count": diff["body_paragraph_count"]
     }
-    with open(detected_path, 'w', encoding='utf-8') as f:
-        json.dump(detected_data, f, ensure_ascii=False, indent=2)
+    write_json_file(detected_path, detected_data)
     
     # Write diff.json
     diff_path = output_dir / f"{standard_id}.diff.json"
-    with open(diff_path, 'w', encoding='utf-8') as f:
-        json.dump(diff, f, ensure_ascii=False, indent=2)
+    write_json_file(diff_path, diff)
     
     # Write debug.html
     html_path = output_dir / f"{standard_id}.debug.html"
     html_content = _generate_debug_html(standard_id, baseline, detected_ids, diff, document)
-    with open(html_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    write_text_file(html_path, html_content)
 
 
 def _generate_debug_html(standard_id: str, baseline: Dict[str, Any], detected_ids: List[Dict[str, Any]], 
@@ -175,111 +245,95 @@ def _generate_debug_html(standard_id: str, baseline: Dict[str, Any], detected_id
     Returns:
         HTML content as string
     """
-    baseline_valid = diff.get("baseline_valid", False)
-    validation_reasons = diff.get("validation_reasons", [])
-    
-    html = f"""<!DOCTYPE html>
-<html dir="rtl" lang="he">
-<head>
-    <meta charset="UTF-8">
-    <title>Debug Report: {standard_id}</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; }}
-        h1, h2 {{ color: #333; }}
-        .metric {{ margin: 10px 0; padding: 10px; background: #f5f5f5; border-radius: 5px; }}
-        .coverage {{ font-size: 24px; font-weight: bold; }}
-        .good {{ color: green; }}
-        .warning {{ color: orange; }}
-        .error {{ color: red; }}
-        .invalid {{ background-color: #ffcccc; padding: 15px; border: 2px solid red; }}
-        table {{ border-collapse: collapse; width: 100%; margin: 20px 0; }}
-        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: right; }}
-        th {{ background-color: #4CAF50; color: white; }}
-        .missing {{ background-color: #ffcccc; }}
-        .extra {{ background-color: #ffffcc; }}
-        pre {{ background: #f5f5f5; padding: 10px; overflow-x: auto; }}
-    </style>
-</head>
-<body>
-    <h1>Debug Report: {standard_id}</h1>
-    
-    <h2>Baseline Validation</h2>
+    if diff.get("baseline_valid", False):
+        return _generate_debug_html_valid(standard_id, baseline, diff)
+    return _generate_debug_html_invalid(standard_id, baseline, diff)
+
+
+def _debug_html_title_and_toc(baseline: Dict[str, Any], toc_pages: Optional[List[int]]) -> str:
+    """Return the title candidate and TOC page sections shared by both report variants."""
+    return f"""
+    <h2>Title Candidates</h2>
+    <div class="metric">
+        <div><strong>Hebrew:</strong> {_escape(baseline['title']['hebrew'] or 'Not found')}</div>
+        <div><strong>English:</strong> {_escape(baseline['title']['english'] or 'Not found')}</div>
+    </div>
+
+    <h2>TOC Pages</h2>
+    <div class="metric">
+        Pages: {', '.join(map(str, toc_pages)) if toc_pages else 'None'}
+    </div>
 """
-    if not baseline_valid:
-        html += f"""    <div class="metric invalid">
+
+
+def _generate_debug_html_invalid(standard_id: str, baseline: Dict[str, Any], diff: Dict[str, Any]) -> str:
+    """Generate the debug report for an invalid baseline (reasons and counts only)."""
+    parts = [_DEBUG_HTML_HEAD_TMPL.format(standard_id=standard_id)]
+    parts.append("""    <div class="metric invalid">
         <h3 style="color: red; margin-top: 0;">⚠ BASELINE_INVALID</h3>
         <p><strong>Baseline validation failed. Diff results are not reliable.</strong></p>
         <ul>
-"""
-        for reason in validation_reasons:
-            html += f"            <li>{reason}</li>\n"
-        html += """        </ul>
-    </div>
-"""
-    else:
-        html += """    <div class="metric good">
-        <p><strong>✓ Baseline Valid</strong></p>
-    </div>
-"""
-    
-    # Only show coverage metrics if baseline is valid
-    if baseline_valid:
-        html += f"""
-    <h2>Coverage Metrics</h2>
-    <div class="metric">
-        <div class="coverage {'good' if diff.get('coverage', 0) >= 0.95 else 'warning' if diff.get('coverage', 0) >= 0.80 else 'error'}">
-            Coverage: {diff.get('coverage', 0):.2%}
-        </div>
-        <div>Baseline Count: {diff.get('baseline_count', 0)}</div>
-        <div>Detected Count: {diff.get('detected_count', 0)}</div>
-        <div>Body Paragraphs: {diff.get('body_paragraph_count', 0)}</div>
+""")
+    for reason in diff.get("validation_reasons", []):
+        parts.append(f"            <li>{_escape(reason)}</li>\n")
+    parts.append(f"""        </ul>
     </div>
-"""
-    else:
-        html += f"""
+
     <h2>Baseline Statistics</h2>
     <div class="metric">
-        <div>Baseline Count: {diff.get('baseline_count', 0)}</div>
-        <div>Detected Count: {diff.get('detected_count', 0)}</div>
-        <div>Body Paragraphs: {diff.get('body_paragraph_count', 0)}</div>
+        <div>Baseline Count: {diff.get("baseline_count", 0)}</div>
+        <div>Detected Count: {diff.get("detected_count", 0)}</div>
+        <div>Body Paragraphs: {diff.get("body_paragraph_count", 0)}</div>
         <div style="color: red; font-weight: bold;">Coverage metrics not available due to invalid baseline</div>
     </div>
-"""
+""")
+    parts.append(_debug_html_title_and_toc(baseline, diff.get("toc_pages")))
+    parts.append(_DEBUG_HTML_TAIL)
+    return "".join(parts)
+
+
+def _generate_debug_html_valid(standard_id: str, baseline: Dict[str, Any], diff: Dict[str, Any]) -> str:
+    """Generate the debug report for a valid baseline, with coverage and ID tables."""
+    coverage = diff.get("coverage", 0)
+    first_failure = diff.get("first_failure")
+    missing_ids = diff.get("missing_ids", [])
+    extra_ids = diff.get("extra_ids", [])
+    missing_count = len(missing_ids)
+    extra_count = len(extra_ids)
     
-    html += f"""
-    <h2>Title Candidates</h2>
-    <div class="metric">
-        <div><strong>Hebrew:</strong> {baseline['title']['hebrew'] or 'Not found'}</div>
-        <div><strong>English:</strong> {baseline['title']['english'] or 'Not found'}</div>
+    parts = [_DEBUG_HTML_HEAD_TMPL.format(standard_id=standard_id)]
+    parts.append(f"""    <div class="metric good">
+        <p><strong>✓ Baseline Valid</strong></p>
     </div>
-"""
-    
-    html += f"""
-    <h2>TOC Pages</h2>
+
+    <h2>Coverage Metrics</h2>
     <div class="metric">
-        Pages: {', '.join(map(str, diff.get('toc_pages', []))) if diff.get('toc_pages') else 'None'}
+        <div class="coverage {'good' if coverage >= 0.95 else 'warning' if coverage >= 0.80 else 'error'}">
+            Coverage: {coverage:.2%}
+        </div>
+        <div>Baseline Count: {diff.get("baseline_count", 0)}</div>
+        <div>Detected Count: {diff.get("detected_count", 0)}</div>
+        <div>Body Paragraphs: {diff.get("body_paragraph_count", 0)}</div>
     </div>
-"""
+""")
+    parts.append(_debug_html_title_and_toc(baseline, diff.get("toc_pages")))
     
-    # Only show diff details if baseline is valid
-    if baseline_valid:
-        html += """
+    parts.append("""
     <h2>First Failure</h2>
-"""
-        if diff.get('first_failure'):
-            html += f"""    <div class="metric error">
-        <div><strong>Token:</strong> {diff['first_failure']['token']}</div>
-        <div><strong>Page:</strong> {diff['first_failure']['page']}</div>
-        <div><strong>Snippet:</strong> {diff['first_failure'].get('snippet', '')}</div>
+""")
+    if first_failure:
+        parts.append(f"""    <div class="metric error">
+        <div><strong>Token:</strong> {_escape(first_failure['token'])}</div>
+        <div><strong>Page:</strong> {first_failure['page']}</div>
+        <div><strong>Snippet:</strong> {_escape(first_failure['snippet'])}</div>
     </div>
-"""
-        else:
-            html += """    <div class="metric good">No failures detected</div>
-"""
-        
-        missing_ids = diff.get('missing_ids', [])
-        html += f"""
-    <h2>Missing IDs ({len(missing_ids)})</h2>
+""")
+    else:
+        parts.append("""    <div class="metric good">No failures detected</div>
+""")
+    
+    parts.append(f"""
+    <h2>Missing IDs ({missing_count})</h2>
     <table>
         <tr>
             <th>Token</th>
@@ -287,48 +341,43 @@ def _generate_debug_html(standard_id: str, baseline: Dict[str, Any], detected_id
             <th>Snippet</th>
             <th>Pattern</th>
         </tr>
-"""
-        for missing in missing_ids[:50]:  # Show first 50
-            html += f"""        <tr class="missing">
-            <td>{missing.get('token', '')}</td>
-            <td>{missing.get('page', '')}</td>
-            <td>{missing.get('snippet', '')}</td>
-            <td>{missing.get('pattern', 'unknown')}</td>
-        </tr>
-"""
-        if len(missing_ids) > 50:
-            html += f"""        <tr><td colspan="4">... and {len(missing_ids) - 50} more</td></tr>
-"""
-        
-        html += """    </table>
+""")
+    parts.append("".join([
+        _MISSING_ROW_TMPL.format_map({
+            "token": _escape(missing['token']),
+            "page": missing['page'],
+            "snippet": _escape(missing['snippet']),
+            "pattern": _escape(missing['pattern']),
+        })
+        for missing in islice(missing_ids, _MAX_REPORT_ROWS)
+    ]))
+    if missing_count > _MAX_REPORT_ROWS:
+        parts.append(f"""        <tr><td colspan="4">... and {missing_count - _MAX_REPORT_ROWS} more</td></tr>
+""")
     
-"""
-        extra_ids = diff.get('extra_ids', [])
-        html += f"""    <h2>Extra IDs ({len(extra_ids)})</h2>
+    parts.append(f"""    </table>
+    
+    <h2>Extra IDs ({extra_count})</h2>
     <table>
         <tr>
             <th>Paragraph ID</th>
             <th>Source</th>
             <th>Snippet</th>
         </tr>
-"""
-        for extra in extra_ids[:50]:  # Show first 50
-            html += f"""        <tr class="extra">
-            <td>{extra.get('paragraph_id', '')}</td>
-            <td>{extra.get('source', '')}</td>
-            <td>{extra.get('snippet', '')}</td>
-        </tr>
-"""
-        if len(extra_ids) > 50:
-            html += f"""        <tr><td colspan="3">... and {len(extra_ids) - 50} more</td></tr>
-"""
-        
-        html += """    </table>
-"""
+""")
+    parts.append("".join([
+        _EXTRA_ROW_TMPL.format_map({
+            "paragraph_id": _escape(extra['paragraph_id']),
+            "source": _escape(extra['source']),
+            "snippet": _escape(extra['snippet']),
+        })
+        for extra in islice(extra_ids, _MAX_REPORT_ROWS)
+    ]))
+    if extra_count > _MAX_REPORT_ROWS:
+        parts.append(f"""        <tr><td colspan="3">... and {extra_count - _MAX_REPORT_ROWS} more</td></tr>
+""")
     
-    html += """
-</body>
-</html>"""
-    
-    return html
-
+    parts.append("""    </table>
+""")
+    parts.append(_DEBUG_HTML_TAIL)
+    return "".join(parts)
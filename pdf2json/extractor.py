@@ -1,7 +1,9 @@
 """Multiple parsing strategies for extracting structure from PDF text."""
 
 import re
-from typing import List, Tuple, Optional, Dict
+from bisect import bisect_right
+from itertools import accumulate, chain, islice, takewhile
+from typing import Iterator, List, Tuple, Optional, Dict
 from pdf2json.models import (
     StandardDocument, StandardTitle, MainContent, Section, Subsection,
     Paragraph, Clause, Table, Footnote, Definition, Exclusions, Exclusion,
@@ -10,6 +12,10 @@ from pdf2json.models import (
 from pdf2json.parser import PDFTextExtractor
 from typing import Any
 
+try:
+    import re2 as _fast_re
+except ImportError:  # optional linear-time engine for the hottest patterns, sre is used otherwise
+    _fast_re = re
 
 # Hebrew to Latin letter mapping for paragraph suffixes
 HEBREW_TO_LATIN: Dict[str, str] = {
@@ -25,6 +31,119 @@ def hebrew_to_latin(hebrew_char: str) -> str:
     return HEBREW_TO_LATIN.get(hebrew_char, hebrew_char)
 
 
+# Hebrew suffix letters -> Latin, applied to a whole suffix in one str.translate pass
+_HEBREW_TO_LATIN_TABLE = str.maketrans(HEBREW_TO_LATIN)
+
+# Latin appendix ID -> Hebrew letter; the first Hebrew letter wins where two share a
+# Latin letter (צ and ק both map to Q)
+LATIN_TO_HEBREW: Dict[str, str] = {
+    latin: hebrew for hebrew, latin in reversed(HEBREW_TO_LATIN.items())
+}
+
+# Appendix paragraph start per Hebrew letter: "ב1", "ב2", "ג1"
+_APPENDIX_PARA_PATTERNS: Dict[str, "re.Pattern[str]"] = {
+    hebrew: re.compile(rf'^\s*{re.escape(hebrew)}(\d+)\s*') for hebrew in HEBREW_TO_LATIN
+}
+
+# Paragraph start: "81א." / "17 ." (number first) or ".20א " (dot first); Hebrew suffix is 1-3 letters.
+# Digits are spelled [0-9] since re2's \d is ASCII-only, so both engines agree.
+_PARAGRAPH_START_RE = _fast_re.compile(
+    r'^(?:(?P<number>[0-9]{1,3})(?P<suffix>[א-ת]{1,3})?\s*\.\s*'
+    r'|\.(?P<dot_number>[0-9]{1,3})(?P<dot_suffix>[א-ת]{1,3})?\s+)'
+)
+
+# Hebrew-lettered markers inside accumulated content: "81ב." and "81 .ב"
+_INLINE_MARKER_SUFFIX_FIRST_RE = re.compile(r'(\d+)\s*([א-ת]+)\s*\.\s*')
+_INLINE_MARKER_DOT_FIRST_RE = re.compile(r'(\d+)\s*\.\s*([א-ת]+)(?=\s|$)')
+
+# Line holding only a paragraph number, with the "." on the next line
+_NUMBER_ONLY_RE = re.compile(r'^(\d{1,3})([א-ת]{1,3})?$')
+_NUMBER_ONLY_SHORT_RE = re.compile(r'^\d+[א-ת]?$')
+
+# Page 1 title: "תקן חשבונאות בינלאומי 16 רכוש קבוע" / "International Accounting Standard 16 ..."
+_HEBREW_TITLE_RE = re.compile(r'תקן\s+חשבונאות\s+בינלאומי\s+(\d+)', re.IGNORECASE)
+_HEBREW_SUBJECT_LINE_RE = re.compile(r'^[א-ת\s]{4,30}$')
+_ENGLISH_TITLE_RE = re.compile(r'International\s+Accounting\s+Standard\s+(\d+)', re.IGNORECASE)
+# Title case words, possibly comma-separated: "Property, Plant and Equipment"
+_ENGLISH_SUBJECT_LINE_RE = re.compile(r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*(?:\s*,\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)*$')
+_ENGLISH_SUBJECT_WORD_RE = re.compile(r'^[A-Z][a-z]+$')
+# Header words that disqualify a subject line (substring) or a single-word line (exact)
+_TITLE_HEADER_WORDS_RE = re.compile(r'International|Accounting|Standard|Financial|Reporting')
+_TITLE_SKIP_WORDS = frozenset({"International", "Accounting", "Standard", "Financial", "Reporting", "The"})
+_ENGLISH_SUBJECT_RE = re.compile(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,5}(?:\s*,\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)*)', re.MULTILINE)
+_COMMA_RE = re.compile(r'\s*,\s*')
+
+# Appendix headings: "נספח ב", "Appendix C"
+# Hebrew has no case, so this one needs no IGNORECASE and can run on re2
+_APPENDIX_HEBREW_RE = _fast_re.compile(r'נספח\s*([א-ת])')
+_APPENDIX_ENGLISH_RE = re.compile(r'Appendix\s*([A-Z])', re.IGNORECASE)
+
+# Front matter / main content boundary
+_TOC_RE = re.compile(r'תוכן\s+עניינים', re.IGNORECASE)
+_MAIN_HEADING_RE = re.compile(r'מטרת\s+התקן', re.IGNORECASE)
+# PRIMARY: "1.", "5.", "16.", "20א.", "81יד." (dot after number/letters, space after dot optional)
+_PARA_NUMBER_DOT_RE = re.compile(r'^(\d+)([א-ת]+)?\.\s*')
+_PARA_ONE_DOT_RE = re.compile(r'^\s*1\.\s*$')  # "1." on its own line
+_PARA_ONE_SPACED_DOT_RE = re.compile(r'^\s*1\s*\.\s*$')  # "1 ." on its own line
+# PRIMARY or FALLBACK (other PDF formats): "16.", "20א." or ".16 ", ".20א "
+_PARA_EARLY_RE = re.compile(r'^(?:(?P<number>\d+)[א-ת]*\.|\.(?P<dot_number>\d+)[א-ת]*\s)')
+_PARA_ONE_RE = re.compile(r'^\s*1\s+')  # "1 " - fallback
+
+# Paragraph markers in structured page text: ".16 ", "20א ", "16A " or "16 " (the shapes are disjoint).
+# ASCII digits as in _PARAGRAPH_START_RE, so it can run on re2 too.
+_TEXT_PARA_START_RE = _fast_re.compile(
+    r'^\s*(?:\.(?P<dot_number>[0-9]{1,3})|(?P<number>[0-9]{1,3})(?:(?P<hebrew>[א-ת])|(?P<latin>[A-Z]))?)\s+'
+)
+
+# Section / subsection title heuristics: "3. Scope", "A. Title", "(a) Title"
+_SECTION_TITLE_RE = re.compile(r"^\d+\.?\s+[A-Z]")
+_SUBSECTION_TITLE_RE = re.compile(r"^[A-Za-z]\.|^\([a-z]\)|^[A-Z]\s+[A-Z]")
+
+# Untranslated-section markers, already lower case and checked in this order
+_EXCLUSION_MARKERS = (
+    "לא תורגם",
+    "not translated",
+    "untranslated",
+    "under translation",
+)
+
+# Definitions inside paragraph content
+_DEFINITION_HEBREW_RE = re.compile(r"([\u0590-\u05FF\w\s]{3,50})\s*[:–—]\s*(.+?)(?=\n|$)", re.MULTILINE | re.IGNORECASE)  # Hebrew term: definition
+_DEFINITION_ENGLISH_RE = re.compile(r"([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s*means?\s+(.+?)(?=\n|$)", re.MULTILINE | re.IGNORECASE)  # English term means definition
+
+
+def _title_match_line_index(match: "re.Match[str]", pattern: "re.Pattern[str]", page1_lines: List[Dict[str, Any]], line_starts: List[int]) -> Optional[int]:
+    """Map a title match in the joined page 1 text back to the first page 1 line that matches."""
+    # The first match in the joined text starts on the first matching line, unless it spans a line break
+    idx = bisect_right(line_starts, match.start()) - 1
+    if match.end() <= line_starts[idx] + len(page1_lines[idx]["text"]):
+        return idx
+    for idx, line in enumerate(page1_lines):
+        if pattern.search(line["text"]):
+            return idx
+    return None
+
+
+def _iter_definition_matches(content: str) -> Iterator["re.Match[str]"]:
+    """Yield Hebrew-style then English-style definition matches in paragraph content.
+    
+    Each pattern is only run when its literal anchor (a separator, or "mean") is present,
+    so paragraphs without definitions are not scanned term-window by term-window.
+    """
+    if ":" in content or "–" in content or "—" in content:
+        yield from _DEFINITION_HEBREW_RE.finditer(content)
+    if "mean" in content.lower():
+        yield from _DEFINITION_ENGLISH_RE.finditer(content)
+
+
+def _match_inline_marker(pattern: "re.Pattern[str]", text: str, number: str, suffix: str) -> Optional["re.Match[str]"]:
+    """Match an inline Hebrew-lettered marker for a specific number and suffix."""
+    match = pattern.match(text)
+    if match and match.group(1) == number and match.group(2) == suffix:
+        return match
+    return None
+
+
 class ParsingStrategy:
     """Base class for parsing strategies."""
     
@@ -51,7 +170,8 @@ class SimpleStrategy(ParsingStrategy):
         baseline_text = extractor.extract_baseline_text()
         
         # Extract standard title and ID from page 1
-        page1_lines = [line for line in positioned_lines if line["page"] == 1]
+        # Lines are sorted by page, so page 1 is a prefix of the list
+        page1_lines = list(takewhile(lambda line: line["page"] == 1, positioned_lines))
         title_hebrew, title_english, extracted_standard_id = self._extract_title_from_page1(page1_lines)
         
         # Use extracted standard_id if found, otherwise use provided one
@@ -64,9 +184,7 @@ class SimpleStrategy(ParsingStrategy):
         main_start_index = self._detect_main_content_start(positioned_lines)
         
         # Split content into main body and appendices
-        main_lines, appendix_lines_dict = self._split_main_and_appendices(
-            positioned_lines[main_start_index:] if main_start_index > 0 else positioned_lines
-        )
+        main_lines, appendix_lines_dict = self._split_main_and_appendices(positioned_lines, main_start_index)
         
         # Parse main content from positioned lines (excluding front matter and TOC)
         main_content = self._parse_main_content_from_lines(main_lines, standard_id)
@@ -120,11 +238,13 @@ class SimpleStrategy(ParsingStrategy):
             return None, None, None
         
         # Get all text from page 1
-        page1_text = "\n".join([line["text"] for line in page1_lines])
+        page1_texts = [line["text"] for line in page1_lines]
+        page1_text = "\n".join(page1_texts)
+        # Offset of each line in page1_text, for mapping title matches back to lines
+        line_starts = list(accumulate((len(text) + 1 for text in page1_texts[:-1]), initial=0))
         
         # Extract Hebrew title: "תקן חשבונאות בינלאומי\s+(\d+)" + next meaningful Hebrew line
-        hebrew_pattern = re.compile(r'תקן\s+חשבונאות\s+בינלאומי\s+(\d+)', re.IGNORECASE)
-        hebrew_match = hebrew_pattern.search(page1_text)
+        hebrew_match = _HEBREW_TITLE_RE.search(page1_text)
         
         hebrew_title = None
         standard_number = None
@@ -133,11 +253,7 @@ class SimpleStrategy(ParsingStrategy):
             standard_number = hebrew_match.group(1)
             # Find the next meaningful Hebrew line after the standard number
             # Look in page1_lines for better accuracy
-            match_line_idx = None
-            for idx, line in enumerate(page1_lines):
-                if hebrew_pattern.search(line["text"]):
-                    match_line_idx = idx
-                    break
+            match_line_idx = _title_match_line_index(hebrew_match, _HEBREW_TITLE_RE, page1_lines, line_starts)
             
             subject = None
             if match_line_idx is not None:
@@ -145,7 +261,7 @@ class SimpleStrategy(ParsingStrategy):
                 for idx in range(match_line_idx + 1, min(match_line_idx + 5, len(page1_lines))):
                     line_text = page1_lines[idx]["text"].strip()
                     # Check if it's a Hebrew subject line (2-4 words, all Hebrew)
-                    if re.match(r'^[א-ת\s]{4,30}$', line_text) and len(line_text.split()) <= 4:
+                    if _HEBREW_SUBJECT_LINE_RE.match(line_text) and len(line_text.split()) <= 4:
                         # Skip if it's just numbers or very short
                         if len(line_text) > 3 and not line_text.isdigit():
                             subject = line_text
@@ -158,8 +274,7 @@ class SimpleStrategy(ParsingStrategy):
                 hebrew_title = f"תקן חשבונאות בינלאומי {standard_number}"
         
         # Extract English title: "International Accounting Standard\s+(\d+)" + next meaningful English line
-        english_pattern = re.compile(r'International\s+Accounting\s+Standard\s+(\d+)', re.IGNORECASE)
-        english_match = english_pattern.search(page1_text)
+        english_match = _ENGLISH_TITLE_RE.search(page1_text)
         
         english_title = None
         
@@ -169,11 +284,7 @@ class SimpleStrategy(ParsingStrategy):
             
             # Find the next meaningful English line after the standard number
             # Look in the lines following the match, not just in remaining text
-            match_line_idx = None
-            for idx, line in enumerate(page1_lines):
-                if english_pattern.search(line["text"]):
-                    match_line_idx = idx
-                    break
+            match_line_idx = _title_match_line_index(english_match, _ENGLISH_TITLE_RE, page1_lines, line_starts)
             
             subject = None
             subject_parts = []
@@ -187,34 +298,30 @@ class SimpleStrategy(ParsingStrategy):
                         continue
                     # Check if line contains title case words (subject line)
                     # Accept lines that are title case words (may be comma-separated)
-                    if re.match(r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*(?:\s*,\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)*$', line_text):
+                    if _ENGLISH_SUBJECT_LINE_RE.match(line_text):
                         # Skip header words
-                        skip_words = ["International", "Accounting", "Standard", "Financial", "Reporting"]
-                        if not any(word in line_text for word in skip_words):
+                        if not _TITLE_HEADER_WORDS_RE.search(line_text):
                             subject_parts.append(line_text)
                     # Also accept single title case words that might be part of a multi-line subject
-                    elif re.match(r'^[A-Z][a-z]+$', line_text) and len(line_text) > 3:
-                        skip_words = ["International", "Accounting", "Standard", "Financial", "Reporting", "The"]
-                        if not any(word == line_text for word in skip_words):
+                    elif _ENGLISH_SUBJECT_WORD_RE.match(line_text) and len(line_text) > 3:
+                        if line_text not in _TITLE_SKIP_WORDS:
                             subject_parts.append(line_text)
                 
                 # Join subject parts (handle wrapped lines like "Property, Plant" / "and Equipment")
                 if subject_parts:
                     subject = " ".join(subject_parts)
                     # Clean up: remove extra spaces around commas
-                    subject = re.sub(r'\s*,\s*', ', ', subject)
+                    subject = _COMMA_RE.sub(', ', subject)
             
             # Fallback: search in remaining text if not found in lines
             if not subject:
                 match_end = english_match.end()
-                remaining_text = page1_text[match_end:]
-                # Look for "Property, Plant and Equipment" pattern
-                # Try to find title case words that form the subject
-                english_subject_pattern = re.compile(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,5}(?:\s*,\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)*)', re.MULTILINE)
-                subject_matches = english_subject_pattern.findall(remaining_text[:1000])
+                # Look for "Property, Plant and Equipment" pattern in the 1000 characters after the match
+                # Try to find title case words that form the subject; stop at the first acceptable one
+                subject_matches = _ENGLISH_SUBJECT_RE.finditer(page1_text, match_end, match_end + 1000)
                 
                 for match in subject_matches:
-                    text = match.strip()
+                    text = match.group(1).strip()
                     # Skip if it's too short or looks like a header
                     if (len(text) > 10 and 
                         text not in ["International", "Accounting", "Standard"] and
@@ -240,82 +347,64 @@ class SimpleStrategy(ParsingStrategy):
         
         return hebrew_title, english_title, extracted_standard_id
     
+    def _iter_body_page_spans(self, positioned_lines: List[Dict[str, Any]]) -> Iterator[Tuple[int, int]]:
+        """Yield (start, end) line index ranges of pages that are not cover or TOC pages.
+        
+        Lines are grouped by page (pages are extracted in order), so each page is one
+        contiguous run. A page is a TOC page if any of its lines contains "תוכן עניינים";
+        pages are only checked when the caller asks for the next span.
+        """
+        total = len(positioned_lines)
+        start = 0
+        while start < total:
+            page = positioned_lines[start]["page"]
+            end = start + 1
+            while end < total and positioned_lines[end]["page"] == page:
+                end += 1
+            # HARD EXCLUDE: page 1 (cover page) and every page that contains the TOC heading
+            if page != 1 and not any(_TOC_RE.search(positioned_lines[i]["text"]) for i in range(start, end)):
+                yield start, end
+            start = end
+    
     def _detect_main_content_start(self, positioned_lines: List[Dict[str, Any]]) -> int:
         """Detect where main content starts (after front matter and TOC).
         
         Returns:
             Index of first line that is part of main content
         """
-        # Pattern for TOC: "תוכן עניינים"
-        toc_pattern = re.compile(r'תוכן\s+עניינים', re.IGNORECASE)
-        
-        # Pattern for main content heading: "מטרת התקן"
-        main_heading_pattern = re.compile(r'מטרת\s+התקן', re.IGNORECASE)
-        
-        # PRIMARY pattern: number-dot format (NUMBER. or NUMBERLETTER.)
-        # Examples: "1.", "5.", "16.", "20א.", "81יד." (dot comes AFTER number/letters)
-        # Space after dot is optional (may be stripped by PDF extraction)
-        para_pattern_number_dot = re.compile(r'^(\d+)([א-ת]+)?\.\s*')  # Primary: "1.", "5.", "16.", "20א."
-        para_pattern_one_dot = re.compile(r'^\s*1\.\s*$')  # "1." on its own line - highest priority for first paragraph
-        
-        # FALLBACK patterns for other PDF formats
-        para_pattern_dot_number = re.compile(r'^\.(\d+)([א-ת]+)?\s+')  # ".16", ".20א" (dot before number)
-        para_pattern_dot_one = re.compile(r'^\.1\s+')  # ".1 " - fallback
-        para_pattern_one = re.compile(r'^\s*1\s+')  # "1 " - fallback
-        
-        toc_pages = set()
         main_start_index = None  # Use None to indicate not found yet
         found_heading = False
         
-        # Find TOC pages - HARD EXCLUDE: mark ALL pages that contain TOC
-        # Only mark pages that actually contain the TOC pattern, not heuristic additional pages
-        # This is more conservative and prevents excluding main content pages
-        for i, line in enumerate(positioned_lines):
-            if toc_pattern.search(line["text"]):
-                toc_pages.add(line["page"])
-        
-        # Also exclude page 1 (cover page) from main content
-        cover_page = 1
-        toc_pages.add(cover_page)
-        
-        # Find first non-TOC page as fallback start
-        first_non_toc_index = None
-        for i, line in enumerate(positioned_lines):
-            if line["page"] not in toc_pages:
-                first_non_toc_index = i
-                break
+        # Walk non-TOC pages lazily: the scan usually stops within the first few body
+        # pages, so the rest of the document is never checked for the TOC heading
+        body_spans = self._iter_body_page_spans(positioned_lines)
+        first_span = next(body_spans, None)
         
         # Find main content start
         # First, try to find paragraph 1 on the first non-TOC page (page 4)
-        first_non_toc_page = None
-        for i, line in enumerate(positioned_lines):
-            if line["page"] not in toc_pages:
-                first_non_toc_page = line["page"]
-                break
-        
-        # Scan the first non-TOC page specifically for paragraph 1
-        if first_non_toc_page is not None:
-            for i, line in enumerate(positioned_lines):
-                if line["page"] != first_non_toc_page:
-                    continue
-                if line["page"] in toc_pages:
-                    continue
+        if first_span is not None:
+            first_non_toc_page = positioned_lines[first_span[0]]["page"]
+            for i in range(*first_span):
+                line = positioned_lines[i]
                 
                 # Check for paragraph 1 in various formats
                 line_text = line["text"].strip()
+                # Every format below starts with a digit
+                if not line_text[:1].isdigit():
+                    continue
                 
                 # Pattern 1: "1." on same line or alone (most common)
-                if para_pattern_one_dot.match(line_text):
+                if _PARA_ONE_DOT_RE.match(line_text):
                     main_start_index = i
                     break
                 
                 # Pattern 1b: "1." with optional whitespace variations
-                if re.match(r'^\s*1\s*\.\s*$', line_text):
+                if _PARA_ONE_SPACED_DOT_RE.match(line_text):
                     main_start_index = i
                     break
                 
                 # Pattern 2: "1." with content on same line
-                match = para_pattern_number_dot.match(line_text)
+                match = _PARA_NUMBER_DOT_RE.match(line_text)
                 if match and match.group(1) == "1":
                     main_start_index = i
                     break
@@ -334,75 +423,60 @@ class SimpleStrategy(ParsingStrategy):
                                     break
                 
                 # Pattern 4: Other early paragraphs (2-5) as fallback
-                if para_pattern_number_dot.match(line_text):
-                    match = para_pattern_number_dot.match(line_text)
-                    if match:
-                        para_num = int(match.group(1))
-                        if 1 <= para_num <= 5:
-                            main_start_index = i
-                            break
+                if match:
+                    para_num = int(match.group(1))
+                    if 1 <= para_num <= 5:
+                        main_start_index = i
+                        break
         
-        # If we still haven't found it, do a broader search
-        if main_start_index is None:
-            for i, line in enumerate(positioned_lines):
-                # Skip if still in TOC pages
-                if line["page"] in toc_pages:
-                    continue
+        # If we still haven't found it, do a broader search over all non-TOC pages
+        if main_start_index is None and first_span is not None:
+            body_indices = chain.from_iterable(range(*span) for span in chain((first_span,), body_spans))
+            for i in body_indices:
+                line_text = positioned_lines[i]["text"]
                 
                 # Check for main heading "מטרת התקן"
-                if main_heading_pattern.search(line["text"]):
+                if _MAIN_HEADING_RE.search(line_text):
                     found_heading = True
                     main_start_index = i
                     # Continue to find the first paragraph after the heading
                     continue
                 
+                # Every paragraph marker below starts with a digit or a dot
+                first_char = line_text.lstrip()[:1]
+                if first_char != "." and not first_char.isdigit():
+                    continue
+                
+                # "1." on its own line is paragraph 1 in every case
+                if _PARA_ONE_DOT_RE.match(line_text):
+                    main_start_index = i
+                    break
+                
+                # One match covers "NUMBER." / "20א." and the fallback ".NUMBER " / ".20א " formats
+                match = _PARA_EARLY_RE.match(line_text)
+                para_num = int(match.group("number") or match.group("dot_number")) if match else None
+                
                 # If we found the heading, look for the first paragraph
                 if found_heading:
-                    # Look for paragraph 1 specifically first ("1. " is the primary pattern)
-                    if para_pattern_one_dot.match(line["text"]):
-                        main_start_index = i
-                        break
-                    # Also accept other number-dot patterns if heading was found
-                    elif para_pattern_number_dot.match(line["text"]):
-                        # Check it's a low number (likely paragraph 1-5)
-                        match = para_pattern_number_dot.match(line["text"])
-                        if match:
-                            para_num = int(match.group(1))
-                            if para_num <= 5:
-                                main_start_index = i
-                                break
-                    # Fallback: dot-number patterns (for other PDF formats)
-                    elif para_pattern_dot_one.match(line["text"]):
-                        main_start_index = i
-                        break
-                    elif para_pattern_dot_number.match(line["text"]):
-                        match = para_pattern_dot_number.match(line["text"])
-                        if match:
-                            para_num = int(match.group(1))
-                            if para_num <= 5:
-                                main_start_index = i
-                                break
+                    # Accept low number-dot or dot-number paragraphs (likely paragraph 1-5)
+                    if match:
+                        if para_num <= 5:
+                            main_start_index = i
+                            break
                     # Fallback: plain number
-                    elif para_pattern_one.match(line["text"]) and len(line["text"].strip()) > 2:
+                    elif _PARA_ONE_RE.match(line_text) and len(line_text.strip()) > 2:
                         main_start_index = i
                         break
                 else:
-                    # If no heading found yet, look for paragraph 1 as start indicator
-                    if para_pattern_one_dot.match(line["text"]):
-                        main_start_index = i
-                        break
                     # Also check for other early paragraphs ("2.", "3.", "5.", etc.) on first body page
-                    elif para_pattern_number_dot.match(line["text"]):
-                        match = para_pattern_number_dot.match(line["text"])
-                        if match:
-                            para_num = int(match.group(1))
-                            if para_num <= 5:  # Early paragraph
-                                main_start_index = i
-                                break
+                    if match and match.group("number") is not None:
+                        if para_num <= 5:  # Early paragraph
+                            main_start_index = i
+                            break
                     # Also check for separate-line format: "1" followed by "." on next line
                     elif i + 1 < len(positioned_lines):
                         next_line_text = positioned_lines[i + 1]["text"].strip()
-                        current_line_text = line["text"].strip()
+                        current_line_text = line_text.strip()
                         if current_line_text == "1" and next_line_text == ".":
                             # Check if line after "." has content
                             if i + 2 < len(positioned_lines):
@@ -410,25 +484,18 @@ class SimpleStrategy(ParsingStrategy):
                                 if content_line and len(content_line) > 2:
                                     main_start_index = i
                                     break
-                    # Fallback: dot-number patterns
-                    elif para_pattern_dot_one.match(line["text"]):
+                    # Fallback: dot-number patterns (only reached on the last line)
+                    elif match and para_num <= 5:  # Early paragraph
                         main_start_index = i
                         break
-                    elif para_pattern_dot_number.match(line["text"]):
-                        match = para_pattern_dot_number.match(line["text"])
-                        if match:
-                            para_num = int(match.group(1))
-                            if para_num <= 5:  # Early paragraph
-                                main_start_index = i
-                                break
         
         # If we didn't find a specific start, use first non-TOC page as fallback
         if main_start_index is None:
-            main_start_index = first_non_toc_index if first_non_toc_index is not None else 0
+            main_start_index = first_span[0] if first_span is not None else 0
         
         return main_start_index
     
-    def _detect_paragraph_start(self, line_text: str) -> Optional[Tuple[str, str, str]]:
+    def _detect_paragraph_start(self, line_text: str) -> Optional[Tuple[str, Optional[str], Optional[str], str]]:
         """Detect if a line starts with a paragraph number token.
         
         Primary pattern: NUMBER. or NUMBERLETTER. (dot comes AFTER number/letters).
@@ -438,81 +505,43 @@ class SimpleStrategy(ParsingStrategy):
             line_text: The line text to check
             
         Returns:
-            Tuple of (normalized_number, suffix_canonical, suffix_display) if paragraph start detected, None otherwise
-            Example: ("20", "A", "א") or ("81", "ID", "יד") or ("7", None, None)
+            Tuple of (normalized_number, suffix_canonical, suffix_display, content) if paragraph start detected,
+            None otherwise. content is the stripped text after the marker.
+            Example: ("20", "A", "א", "...") or ("81", "ID", "יד", "...") or ("7", None, None, "")
         """
         line_text = line_text.strip()
-        if not line_text:
-            return None
-        
-        # Ignore artifacts: ranges like "69-68", "33-32" (reversed ranges), or bracketed notes like "[בוטל]"
-        # Also ignore ranges with spaces like "33-32 ."
-        # Check if line starts with a range pattern
-        if (re.match(r'^\d+-\d+', line_text) or 
-            re.match(r'^\d+\s*-\s*\d+', line_text) or 
-            re.match(r'^\[בוטל\]', line_text)):
+        # Markers start with a digit or a dot; most lines are continuation text
+        first_char = line_text[:1]
+        if first_char != "." and not first_char.isdigit():
             return None
         
-        # Also check if line contains a reversed range pattern like "33-32 ." at the start
-        # This is a reference format, not a paragraph marker
-        if re.match(r'^\d+\s*-\s*\d+\s*\.', line_text):
+        # PRIMARY PATTERN: "5.", "81.", "81א.", "81יד.", "17 ." (dot comes AFTER number/letters)
+        # FALLBACK PATTERN: ".16", ".20א", ".81יד" (dot before number, other PDF formats)
+        # Range artifacts ("69-68", "33-32 .") and notes like "[בוטל]" cannot match either shape
+        match = _PARAGRAPH_START_RE.match(line_text)
+        if not match:
             return None
         
-        # PRIMARY PATTERN: Number-dot with optional Hebrew suffix (single or multi-letter)
-        # Pattern: "5.", "81.", "81א.", "81יד.", "17 .", "36 ." (dot comes AFTER number/letters)
-        # Handle both "17." and "17 ." formats (space before dot is optional)
-        # Hebrew suffix can be 1-3 letters (א, ב, יד, טו, etc.)
-        # Space after dot is optional (may be stripped by PDF extraction)
-        # Paragraph number may be on its own line (just "1.") or on same line as content
-        pattern_number_dot = re.compile(r'^(\d{1,3})([א-ת]{1,3})?\s*\.\s*')
-        match_primary = pattern_number_dot.match(line_text)
-        
-        if match_primary:
-            number = match_primary.group(1)
-            suffix_hebrew = match_primary.group(2) if match_primary.lastindex >= 2 and match_primary.group(2) else None
-            
-            # Check that there's content after the paragraph marker OR line is just the paragraph number
-            # (content will be on next line in that case)
-            rest = line_text[match_primary.end():].strip()
+        rest = line_text[match.end():].strip()
+        number = match.group("number")
+        if number is not None:
             # Accept if: (1) content on same line (even if short), OR (2) line is just "NUMBER." (content on next line)
-            # Be more lenient - accept if there's any content or if line is just the paragraph marker
-            if (rest and len(rest) > 0) or (not rest and len(line_text.strip()) <= 10):
-                # Convert Hebrew suffix to canonical (Latin)
-                suffix_canonical = None
-                if suffix_hebrew:
-                    # Handle multi-letter Hebrew (e.g., "יד" -> "ID")
-                    if len(suffix_hebrew) == 1:
-                        suffix_canonical = hebrew_to_latin(suffix_hebrew)
-                    else:
-                        # Multi-letter: convert each letter
-                        suffix_canonical = "".join(hebrew_to_latin(c) for c in suffix_hebrew)
-                
-                return (number, suffix_canonical, suffix_hebrew)
-        
-        # FALLBACK PATTERN 1: Dot-number with optional Hebrew suffix: ".16", ".20א", ".81יד"
-        # For other PDF formats that use dot before number
-        pattern_dot_number = re.compile(r'^\.(\d{1,3})([א-ת]{1,3})?\s+')
-        match_dot = pattern_dot_number.match(line_text)
-        if match_dot:
-            number = match_dot.group(1)
-            suffix_hebrew = match_dot.group(2) if match_dot.group(2) else None
-            
-            # Check that there's content after the paragraph marker
-            rest = line_text[match_dot.end():].strip()
-            if rest and len(rest) > 2:
-                # Convert Hebrew suffix to canonical (Latin)
-                suffix_canonical = None
-                if suffix_hebrew:
-                    # Handle multi-letter Hebrew (e.g., "יד" -> "ID")
-                    if len(suffix_hebrew) == 1:
-                        suffix_canonical = hebrew_to_latin(suffix_hebrew)
-                    else:
-                        # Multi-letter: convert each letter
-                        suffix_canonical = "".join(hebrew_to_latin(c) for c in suffix_hebrew)
-                
-                return (number, suffix_canonical, suffix_hebrew)
-        
-        return None
+            if not rest and len(line_text) > 10:
+                return None
+            suffix_hebrew = match.group("suffix")
+        else:
+            # Dot-number lines need real content after the marker
+            if len(rest) <= 2:
+                return None
+            number = match.group("dot_number")
+            suffix_hebrew = match.group("dot_suffix")
+        
+        # Convert Hebrew suffix to canonical (Latin), letter by letter for multi-letter suffixes ("יד" -> "ID")
+        suffix_canonical = None
+        if suffix_hebrew:
+            suffix_canonical = suffix_hebrew.translate(_HEBREW_TO_LATIN_TABLE)
+        
+        return (number, suffix_canonical, suffix_hebrew, rest)
     
     def _detect_hebrew_lettered_paragraph_in_content(self, content: str) -> Optional[Tuple[str, str, str, int]]:
         """Detect if accumulated content contains a Hebrew-lettered paragraph marker.
@@ -572,10 +601,7 @@ class SimpleStrategy(ParsingStrategy):
             split_index = match.start()
         
         # Convert Hebrew suffix to canonical (Latin)
-        if len(suffix_hebrew) == 1:
-            suffix_canonical = hebrew_to_latin(suffix_hebrew)
-        else:
-            suffix_canonical = "".join(hebrew_to_latin(c) for c in suffix_hebrew)
+        suffix_canonical = suffix_hebrew.translate(_HEBREW_TO_LATIN_TABLE)
         
         # Return the paragraph info and the position where it starts
         split_index = match.start()
@@ -595,10 +621,7 @@ class SimpleStrategy(ParsingStrategy):
         suffix_hebrew = match.group(2)
         
         # Convert Hebrew suffix to canonical (Latin)
-        if len(suffix_hebrew) == 1:
-            suffix_canonical = hebrew_to_latin(suffix_hebrew)
-        else:
-            suffix_canonical = "".join(hebrew_to_latin(c) for c in suffix_hebrew)
+        suffix_canonical = suffix_hebrew.translate(_HEBREW_TO_LATIN_TABLE)
         
         # Return the paragraph info and the position where it starts
         split_index = match.start()
@@ -663,13 +686,17 @@ class SimpleStrategy(ParsingStrategy):
         current_paragraph: Optional[Paragraph] = None
         current_para_number: Optional[int] = None  # Track current paragraph number for sequential validation
         processed_indices = set()  # Track lines that have been processed (for separate-line format)
+        # Stripped text per line, read once: the separate-line checks look at neighbouring lines by index
+        stripped_texts = [line["text"].strip() for line in positioned_lines]
+        line_count = len(positioned_lines)
         
         for line_idx, line in enumerate(positioned_lines):
             # Skip already processed lines
             if line_idx in processed_indices:
                 continue
             line_text = line["text"]
-            if not line_text.strip():
+            stripped_text = stripped_texts[line_idx]
+            if not stripped_text:
                 # Empty line - continue accumulating into current paragraph
                 if current_paragraph:
                     current_paragraph.content += "\n"
@@ -677,33 +704,29 @@ class SimpleStrategy(ParsingStrategy):
             
             # Skip "." lines that are part of separate-line format (number on previous line, "." on this line)
             if line_idx > 0:
-                prev_line_text = positioned_lines[line_idx - 1]["text"].strip()
-                if line_text.strip() == '.' and prev_line_text and re.match(r'^\d+[א-ת]?$', prev_line_text):
+                prev_line_text = stripped_texts[line_idx - 1]
+                if stripped_text == '.' and prev_line_text and _NUMBER_ONLY_SHORT_RE.match(prev_line_text):
                     # This is a "." line following a number - skip it (content will be on next line)
                     continue
             
             # Check for number-dot on separate lines: "22" followed by "." on next line
             para_start = None
-            if line_idx + 1 < len(positioned_lines):
-                next_line_text = positioned_lines[line_idx + 1]["text"].strip()
+            if line_idx + 1 < line_count:
+                next_line_text = stripped_texts[line_idx + 1]
                 # Pattern: current line is just a number (possibly with Hebrew suffix), next line is just "."
-                number_only_pattern = re.compile(r'^(\d{1,3})([א-ת]{1,3})?$')
-                match_number_only = number_only_pattern.match(line_text.strip())
+                match_number_only = _NUMBER_ONLY_RE.match(stripped_text)
                 if match_number_only and next_line_text == '.':
                     number = match_number_only.group(1)
                     suffix_hebrew = match_number_only.group(2) if match_number_only.lastindex >= 2 and match_number_only.group(2) else None
                     # Check if line after "." has content
-                    if line_idx + 2 < len(positioned_lines):
-                        content_line = positioned_lines[line_idx + 2]["text"].strip()
+                    if line_idx + 2 < line_count:
+                        content_line = stripped_texts[line_idx + 2]
                         if content_line and len(content_line) > 2:
                             # Convert Hebrew suffix to canonical
                             suffix_canonical = None
                             if suffix_hebrew:
-                                if len(suffix_hebrew) == 1:
-                                    suffix_canonical = hebrew_to_latin(suffix_hebrew)
-                                else:
-                                    suffix_canonical = "".join(hebrew_to_latin(c) for c in suffix_hebrew)
-                            para_start = (number, suffix_canonical, suffix_hebrew)
+                                suffix_canonical = suffix_hebrew.translate(_HEBREW_TO_LATIN_TABLE)
+                            para_start = (number, suffix_canonical, suffix_hebrew, None)
                             # Mark the "." line (line_idx + 1) as processed - we'll skip it
                             processed_indices.add(line_idx + 1)
             
@@ -712,8 +735,8 @@ class SimpleStrategy(ParsingStrategy):
                 para_start = self._detect_paragraph_start(line_text)
             
             if para_start:
-                # Extract paragraph number, canonical suffix, and display suffix
-                para_number, para_suffix_canonical, para_suffix_display = para_start
+                # Extract paragraph number, canonical suffix, display suffix and content after the marker
+                para_number, para_suffix_canonical, para_suffix_display, content_after_marker = para_start
                 
                 # Validate paragraph sequence (reject false positives like "39" after "35")
                 para_number_int = int(para_number)
@@ -749,58 +772,23 @@ class SimpleStrategy(ParsingStrategy):
                 # Extract content (everything after paragraph marker)
                 # Check if this is separate-line format (number on this line, "." on next, content on line after)
                 content = ""
-                is_separate_line_format = (line_idx + 1 < len(positioned_lines) and 
-                                          positioned_lines[line_idx + 1]["text"].strip() == '.' and
-                                          para_start and line_text.strip() and 
-                                          re.match(r'^\d+[א-ת]?$', line_text.strip()))
+                is_separate_line_format = (line_idx + 1 < line_count and 
+                                          stripped_texts[line_idx + 1] == '.' and
+                                          para_start and stripped_text and 
+                                          _NUMBER_ONLY_SHORT_RE.match(stripped_text))
                 
                 if is_separate_line_format:
                     # Separate-line format: content starts on line_idx + 2
-                    if line_idx + 2 < len(positioned_lines):
-                        content = positioned_lines[line_idx + 2]["text"].strip()
+                    if line_idx + 2 < line_count:
+                        content = stripped_texts[line_idx + 2]
                         # Mark the content line as processed (it's already in the paragraph)
                         processed_indices.add(line_idx + 2)
+                elif content_after_marker is not None:
+                    # Normal format: content on same line (or next line, if the marker stands alone)
+                    content = content_after_marker
                 else:
-                    # Normal format: content on same line or next line
-                    # Primary pattern: "5.", "81.", "81א." (number-dot format)
+                    # Number-only line that is not a separate-line marker: keep the line as content
                     content = line_text
-                    if para_suffix_display:
-                        # Pattern with Hebrew suffix: "81א.", "81יד.", "17 .א" (space before/after dot is optional)
-                        pattern = re.compile(rf'^{re.escape(para_number)}{re.escape(para_suffix_display)}\s*\.\s*')
-                        match = pattern.match(line_text)
-                        if match:
-                            content = line_text[match.end():].strip()
-                        else:
-                            # Try without suffix: "81."
-                            pattern = re.compile(rf'^{re.escape(para_number)}\s*\.\s*')
-                            match = pattern.match(line_text)
-                            if match:
-                                content = line_text[match.end():].strip()
-                            else:
-                                # Fallback: try dot-prefixed pattern ".81א "
-                                pattern = re.compile(rf'^\.{re.escape(para_number)}{re.escape(para_suffix_display)}\s+')
-                                match = pattern.match(line_text)
-                                if match:
-                                    content = line_text[match.end():].strip()
-                                else:
-                                    # Try dot-prefixed without suffix ".81 "
-                                    pattern = re.compile(rf'^\.{re.escape(para_number)}\s+')
-                                    match = pattern.match(line_text)
-                                    if match:
-                                        content = line_text[match.end():].strip()
-                    else:
-                        # Pattern without suffix: "5.", "81.", "17 ." (space before/after dot is optional)
-                        # Handle both "17." and "17 ." formats
-                        pattern = re.compile(rf'^{re.escape(para_number)}\s*\.\s*')
-                        match = pattern.match(line_text)
-                        if match:
-                            content = line_text[match.end():].strip()
-                        else:
-                            # Fallback: try dot-prefixed pattern ".81 "
-                            pattern = re.compile(rf'^\.{re.escape(para_number)}\s+')
-                            match = pattern.match(line_text)
-                            if match:
-                                content = line_text[match.end():].strip()
                 
                 # Start new paragraph
                 current_paragraph = Paragraph(
@@ -872,15 +860,12 @@ class SimpleStrategy(ParsingStrategy):
                         # Extract content after the paragraph marker
                         # Handle both formats: "81ב." and "81 .ב"
                         # Try pattern 1: Hebrew letter before dot "81ב."
-                        marker_pattern1 = re.compile(rf'^{re.escape(para_number)}\s*{re.escape(para_suffix_display)}\s*\.\s*')
-                        # Try pattern 2: Dot before Hebrew letter "81 .ב"
-                        marker_pattern2 = re.compile(rf'^{re.escape(para_number)}\s*\.\s*{re.escape(para_suffix_display)}(?=\s|$)')
-                        
-                        match = marker_pattern1.match(content_from_marker)
+                        match = _match_inline_marker(_INLINE_MARKER_SUFFIX_FIRST_RE, content_from_marker, para_number, para_suffix_display)
                         if match:
                             new_content = content_from_marker[match.end():].strip()
                         else:
-                            match = marker_pattern2.match(content_from_marker)
+                            # Try pattern 2: Dot before Hebrew letter "81 .ב"
+                            match = _match_inline_marker(_INLINE_MARKER_DOT_FIRST_RE, content_from_marker, para_number, para_suffix_display)
                             if match:
                                 # For "81 .ב" format, content starts after the Hebrew letter
                                 new_content = content_from_marker[match.end():].strip()
@@ -892,8 +877,7 @@ class SimpleStrategy(ParsingStrategy):
                         para_number_int = int(para_number)
                         if not self._is_valid_paragraph_sequence(current_para_number, para_number, para_suffix_display):
                             # Invalid sequence - skip this marker, continue with remaining content
-                            marker_pattern = re.compile(rf'^{re.escape(para_number)}\s*{re.escape(para_suffix_display)}\s*\.\s*')
-                            match = marker_pattern.match(content_from_marker)
+                            match = _match_inline_marker(_INLINE_MARKER_SUFFIX_FIRST_RE, content_from_marker, para_number, para_suffix_display)
                             if match:
                                 # Skip past this invalid marker
                                 remaining_content = remaining_content[:split_index] + remaining_content[split_index + match.end():]
@@ -979,8 +963,7 @@ class SimpleStrategy(ParsingStrategy):
                 para_number_int = int(para_number)
                 if not self._is_valid_paragraph_sequence(current_para_number, para_number, para_suffix_display):
                     # Invalid sequence - skip this marker, continue with remaining content
-                    marker_pattern = re.compile(rf'^{re.escape(para_number)}\s*{re.escape(para_suffix_display)}\s*\.\s*')
-                    match = marker_pattern.match(content_from_marker)
+                    match = _match_inline_marker(_INLINE_MARKER_SUFFIX_FIRST_RE, content_from_marker, para_number, para_suffix_display)
                     if match:
                         # Skip past this invalid marker
                         remaining_content = remaining_content[:split_index] + remaining_content[split_index + match.end():]
@@ -992,15 +975,12 @@ class SimpleStrategy(ParsingStrategy):
                 # Extract content after the paragraph marker
                 # Handle both formats: "81ב." and "81 .ב"
                 # Try pattern 1: Hebrew letter before dot "81ב."
-                marker_pattern1 = re.compile(rf'^{re.escape(para_number)}\s*{re.escape(para_suffix_display)}\s*\.\s*')
-                # Try pattern 2: Dot before Hebrew letter "81 .ב"
-                marker_pattern2 = re.compile(rf'^{re.escape(para_number)}\s*\.\s*{re.escape(para_suffix_display)}(?=\s|$)')
-                
-                match = marker_pattern1.match(content_from_marker)
+                match = _match_inline_marker(_INLINE_MARKER_SUFFIX_FIRST_RE, content_from_marker, para_number, para_suffix_display)
                 if match:
                     new_content = content_from_marker[match.end():].strip()
                 else:
-                    match = marker_pattern2.match(content_from_marker)
+                    # Try pattern 2: Dot before Hebrew letter "81 .ב"
+                    match = _match_inline_marker(_INLINE_MARKER_DOT_FIRST_RE, content_from_marker, para_number, para_suffix_display)
                     if match:
                         # For "81 .ב" format, content starts after the Hebrew letter
                         new_content = content_from_marker[match.end():].strip()
@@ -1032,34 +1012,34 @@ class SimpleStrategy(ParsingStrategy):
         
         return MainContent(sections=[main_section])
     
-    def _split_main_and_appendices(self, positioned_lines: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+    def _split_main_and_appendices(self, positioned_lines: List[Dict[str, Any]], start: int = 0) -> Tuple[List[Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
         """Split positioned lines into main content and appendices.
         
+        Args:
+            positioned_lines: All positioned lines of the document
+            start: Index of the first main content line; earlier lines are skipped
+            
         Returns:
             Tuple of (main_lines, appendix_lines_dict) where appendix_lines_dict maps 'A', 'B', 'C' to their lines
         """
-        # Patterns for appendix detection
-        appendix_pattern_hebrew = re.compile(r'נספח\s*([א-ת])', re.IGNORECASE)
-        appendix_pattern_english = re.compile(r'Appendix\s*([A-Z])', re.IGNORECASE)
-        
         main_lines = []
         appendix_lines_dict: Dict[str, List[Dict[str, Any]]] = {}
         current_appendix = None
         
-        for line in positioned_lines:
+        for line in islice(positioned_lines, start, None):
             line_text = line["text"]
             
-            # Check for appendix marker
-            hebrew_match = appendix_pattern_hebrew.search(line_text)
-            english_match = appendix_pattern_english.search(line_text)
+            # Check for appendix marker; markers are rare, so substring tests spare most lines
+            # the regex searches ("Appendix" in any letter case contains "p" or "P")
+            hebrew_match = _APPENDIX_HEBREW_RE.search(line_text) if "נספח" in line_text else None
+            english_match = None
+            if not hebrew_match and ("p" in line_text or "P" in line_text):
+                english_match = _APPENDIX_ENGLISH_RE.search(line_text)
             
             if hebrew_match:
                 appendix_letter_hebrew = hebrew_match.group(1)
-                # Convert Hebrew to Latin
-                if appendix_letter_hebrew in HEBREW_TO_LATIN:
-                    current_appendix = hebrew_to_latin(appendix_letter_hebrew)
-                else:
-                    current_appendix = appendix_letter_hebrew.upper()
+                # Convert Hebrew to Latin (mapped letters are already upper case)
+                current_appendix = appendix_letter_hebrew.translate(_HEBREW_TO_LATIN_TABLE).upper()
             elif english_match:
                 current_appendix = english_match.group(1).upper()
             
@@ -1085,31 +1065,34 @@ class SimpleStrategy(ParsingStrategy):
             Appendix object with parsed content
         """
         paragraphs: List[Paragraph] = []
-        current_paragraph: Optional[Paragraph] = None
+        # (paragraph_id, paragraph_id_display) of the open paragraph; its Paragraph is
+        # built once, from the joined content pieces, when it is closed
+        current_ids: Optional[Tuple[str, Optional[str]]] = None
+        content_parts: List[str] = []
         
         # Hebrew letter for this appendix (for paragraph numbering)
-        hebrew_letter = None
-        for heb, lat in HEBREW_TO_LATIN.items():
-            if lat == appendix_id:
-                hebrew_letter = heb
-                break
+        hebrew_letter = LATIN_TO_HEBREW.get(appendix_id)
+        appendix_para_pattern = _APPENDIX_PARA_PATTERNS.get(hebrew_letter)
         
         for line in appendix_lines:
             line_text = line["text"]
             if not line_text.strip():
-                if current_paragraph:
-                    current_paragraph.content += "\n"
+                if current_ids:
+                    content_parts.append("\n")
                 continue
             
             # Detect appendix paragraph start (e.g., "ב1", "ב2", "ג1")
             # Pattern: Hebrew letter followed by number
-            if hebrew_letter:
-                appendix_para_pattern = re.compile(rf'^\s*{re.escape(hebrew_letter)}(\d+)\s*')
+            if appendix_para_pattern:
                 match = appendix_para_pattern.match(line_text)
                 if match:
                     # Close previous paragraph
-                    if current_paragraph:
-                        paragraphs.append(current_paragraph)
+                    if current_ids:
+                        paragraphs.append(Paragraph(
+                            paragraph_id=current_ids[0],
+                            paragraph_id_display=current_ids[1],
+                            content="".join(content_parts)
+                        ))
                     
                     para_number = match.group(1)
                     # Build paragraph ID: IAS_16:B1 (canonical), IAS_16:ב1 (display)
@@ -1119,23 +1102,21 @@ class SimpleStrategy(ParsingStrategy):
                     # Extract content
                     content = line_text[match.end():].strip()
                     
-                    current_paragraph = Paragraph(
-                        paragraph_id=para_id,
-                        paragraph_id_display=para_id_display,
-                        content=content,
-                        clauses=[],
-                        tables=[],
-                        footnotes=[]
-                    )
+                    current_ids = (para_id, para_id_display)
+                    content_parts = [content] if content else []
                     continue
             
             # Also check for regular paragraph patterns in appendices
             para_start = self._detect_paragraph_start(line_text)
             if para_start:
-                if current_paragraph:
-                    paragraphs.append(current_paragraph)
+                if current_ids:
+                    paragraphs.append(Paragraph(
+                        paragraph_id=current_ids[0],
+                        paragraph_id_display=current_ids[1],
+                        content="".join(content_parts)
+                    ))
                 
-                para_number, para_suffix_canonical, para_suffix_display = para_start
+                para_number, para_suffix_canonical, para_suffix_display, content_after_marker = para_start
                 
                 # Build canonical paragraph ID
                 if para_suffix_canonical:
@@ -1149,43 +1130,25 @@ class SimpleStrategy(ParsingStrategy):
                 else:
                     para_id_display = None
                 
-                # Extract content (primary pattern: ".16", ".20א", ".81יד")
-                content = line_text
-                if para_suffix_display:
-                    pattern = re.compile(rf'^\.{re.escape(para_number)}{re.escape(para_suffix_display)}\s+')
-                    match = pattern.match(line_text)
-                    if match:
-                        content = line_text[match.end():].strip()
-                    else:
-                        pattern = re.compile(rf'^\.{re.escape(para_number)}\s+')
-                        match = pattern.match(line_text)
-                        if match:
-                            content = line_text[match.end():].strip()
-                else:
-                    pattern = re.compile(rf'^\.{re.escape(para_number)}\s+')
-                    match = pattern.match(line_text)
-                    if match:
-                        content = line_text[match.end():].strip()
+                # Extract content: only the dot-prefixed pattern is stripped here (".16", ".20א", ".81יד")
+                content = content_after_marker if line_text.startswith(".") else line_text
                 
-                current_paragraph = Paragraph(
-                    paragraph_id=para_id,
-                    paragraph_id_display=para_id_display,
-                    content=content,
-                    clauses=[],
-                    tables=[],
-                    footnotes=[]
-                )
+                current_ids = (para_id, para_id_display)
+                content_parts = [content] if content else []
             else:
                 # Accumulate into current paragraph
-                if current_paragraph:
-                    if current_paragraph.content:
-                        current_paragraph.content += " " + line_text
-                    else:
-                        current_paragraph.content = line_text
+                if current_ids:
+                    if content_parts:
+                        content_parts.append(" ")
+                    content_parts.append(line_text)
         
         # Close final paragraph
-        if current_paragraph:
-            paragraphs.append(current_paragraph)
+        if current_ids:
+            paragraphs.append(Paragraph(
+                paragraph_id=current_ids[0],
+                paragraph_id_display=current_ids[1],
+                content="".join(content_parts)
+            ))
         
         # Create sections for appendix (for now, single section with all paragraphs)
         sections = []
@@ -1204,26 +1167,21 @@ class SimpleStrategy(ParsingStrategy):
     
     def _parse_main_content(self, structured_text: List[Tuple[int, str, dict]], standard_id: str) -> MainContent:
         """Parse main content sections with improved Hebrew paragraph detection."""
-        sections: List[Section] = []
         current_section: Optional[Section] = None
         current_subsection: Optional[Subsection] = None
         current_paragraph: Optional[Paragraph] = None
         
-        # Paragraph patterns:
-        # 1. Dot-number pattern: ".16 " or ".1 " (e.g., ".16 ")
-        pattern_dot_number = re.compile(r'^\s*\.(\d{1,3})\s+')
-        
-        # 2. Number + Hebrew letter: "16א " or "20ב " (e.g., "20א ")
-        # Hebrew letters: א-ת
-        pattern_hebrew_suffix = re.compile(r'^\s*(\d{1,3})([א-ת])\s+')
+        match_para_start = _TEXT_PARA_START_RE.match
+        # Content lines of current_paragraph, joined once when it is closed
+        content_lines: List[str] = []
         
-        # 3. Number + Latin letter: "16A " or "20B " (already normalized)
-        pattern_latin_suffix = re.compile(r'^\s*(\d{1,3})([A-Z])\s+')
-        
-        # 4. Plain number at start: "16 " (fallback)
-        pattern_plain_number = re.compile(r'^\s*(\d{1,3})\s+')
-        
-        all_paragraphs: List[Paragraph] = []  # Collect all paragraphs first
+        # All paragraphs go into a single default section, appended in place
+        main_section = Section(
+            section_title="Main Content",
+            paragraphs=[],
+            subsections=[]
+        )
+        all_paragraphs = main_section.paragraphs
         
         for page_num, text, metadata in structured_text:
             lines = text.split("\n")
@@ -1234,51 +1192,27 @@ class SimpleStrategy(ParsingStrategy):
                 if not line:
                     continue
                 
-                # Try to detect paragraph start
-                para_match = None
-                para_number = None
+                # Try to detect paragraph start; one match classifies the marker shape.
+                # Markers start with a digit or a dot; most lines are continuation text
+                first_char = line[0]
+                para_match = match_para_start(line) if first_char == "." or first_char.isdigit() else None
                 para_suffix = None
-                para_suffix_display = None  # Original suffix for display
-                
-                # Try patterns in order of specificity
-                match_dot = pattern_dot_number.match(line)
-                if match_dot:
-                    para_match = match_dot
-                    para_number = match_dot.group(1)
-                    para_suffix = None
-                    para_suffix_display = None
-                
-                if not para_match:
-                    match_hebrew = pattern_hebrew_suffix.match(line)
-                    if match_hebrew:
-                        para_match = match_hebrew
-                        para_number = match_hebrew.group(1)
-                        hebrew_char = match_hebrew.group(2)
-                        para_suffix_display = hebrew_char
-                        para_suffix = hebrew_to_latin(hebrew_char)
-                
-                if not para_match:
-                    match_latin = pattern_latin_suffix.match(line)
-                    if match_latin:
-                        para_match = match_latin
-                        para_number = match_latin.group(1)
-                        para_suffix = match_latin.group(2)
-                        para_suffix_display = para_suffix
-                
-                if not para_match:
-                    match_plain = pattern_plain_number.match(line)
-                    if match_plain:
+                if para_match:
+                    para_number = para_match.group("number")
+                    if para_number is None:
+                        para_number = para_match.group("dot_number")
+                    elif para_match.group("hebrew"):
+                        para_suffix = para_match.group("hebrew").translate(_HEBREW_TO_LATIN_TABLE)
+                    elif para_match.group("latin"):
+                        para_suffix = para_match.group("latin")
+                    elif len(line) - para_match.end() <= 5:
                         # Only use plain number if it looks like a paragraph (followed by text, not just a number)
-                        rest = line[match_plain.end():].strip()
-                        if rest and len(rest) > 5:  # Has meaningful content after number
-                            para_match = match_plain
-                            para_number = match_plain.group(1)
-                            para_suffix = None
-                            para_suffix_display = None
+                        para_match = None
                 
                 if para_match:
                     # Close previous paragraph if exists
                     if current_paragraph:
+                        current_paragraph.content = " ".join(content_lines)
                         all_paragraphs.append(current_paragraph)
                     
                     # Build paragraph ID
@@ -1287,8 +1221,8 @@ class SimpleStrategy(ParsingStrategy):
                     else:
                         para_id = f"{standard_id}:{para_number}"
                     
-                    # Extract content (everything after paragraph marker)
-                    content = line[para_match.end():].strip()
+                    # Extract content (everything after paragraph marker; \s+ already ate the gap)
+                    content = line[para_match.end():]
                     
                     # Start new paragraph
                     current_paragraph = Paragraph(
@@ -1298,53 +1232,40 @@ class SimpleStrategy(ParsingStrategy):
                         tables=[],
                         footnotes=[]
                     )
+                    content_lines = [content] if content else []
                 else:
                     # Accumulate content into current paragraph
                     if current_paragraph:
-                        # Add line to current paragraph content
-                        if current_paragraph.content:
-                            current_paragraph.content += " " + line
-                        else:
-                            current_paragraph.content = line
+                        content_lines.append(line)
         
         # Close final paragraph
         if current_paragraph:
+            current_paragraph.content = " ".join(content_lines)
             all_paragraphs.append(current_paragraph)
         
-        # Assign paragraphs to a section
-        # For now, create a single main section if we have paragraphs
-        if all_paragraphs:
-            # Create a default section with all paragraphs
-            main_section = Section(
-                section_title="Main Content",
-                paragraphs=all_paragraphs,
-                subsections=[]
-            )
-            sections.append(main_section)
-        elif not sections:
-            # No paragraphs and no sections - create empty section
-            sections.append(Section(
-                section_title="Main Content",
-                paragraphs=[],
-                subsections=[]
-            ))
-        
-        return MainContent(sections=sections)
+        # The section is kept even when empty
+        return MainContent(sections=[main_section])
     
     def _is_section_title(self, line: str) -> bool:
         """Heuristic to detect section titles."""
+        line_length = len(line)
+        if line_length >= 100:
+            return False
         # All caps and short
-        if line.isupper() and len(line) < 100 and len(line) > 3:
+        if line_length > 3 and line.isupper():
             return True
         # Starts with number and is short
-        if re.match(r"^\d+\.?\s+[A-Z]", line) and len(line) < 100:
+        if line[:1].isdigit() and _SECTION_TITLE_RE.match(line):
             return True
         return False
     
     def _is_subsection_title(self, line: str) -> bool:
         """Heuristic to detect subsection titles."""
-        # Pattern like "A. Title" or "(a) Title"
-        if re.match(r"^[A-Za-z]\.|^\([a-z]\)|^[A-Z]\s+[A-Z]", line[:20]):
+        # Pattern like "A. Title" or "(a) Title"; every shape starts with an ASCII letter or "("
+        first_char = line[:1]
+        if first_char != "(" and not (first_char.isascii() and first_char.isalpha()):
+            return False
+        if _SUBSECTION_TITLE_RE.match(line[:20]):
             return True
         return False
     
@@ -1362,22 +1283,16 @@ class SimpleStrategy(ParsingStrategy):
                 for para in section.paragraphs:
                     # Look for definition patterns in paragraph content
                     # Pattern: Hebrew term: definition or English term means definition
-                    definition_patterns = [
-                        r"([\u0590-\u05FF\w\s]{3,50})\s*[:–—]\s*(.+?)(?=\n|$)",  # Hebrew term: definition
-                        r"([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s*means?\s+(.+?)(?=\n|$)",  # English term means definition
-                    ]
-                    for pattern in definition_patterns:
-                        matches = re.finditer(pattern, para.content, re.MULTILINE | re.IGNORECASE)
-                        for match in matches:
-                            term = match.group(1).strip()
-                            definition = match.group(2).strip()
-                            
-                            if len(term) > 2 and len(definition) > 10:
-                                definitions.append(Definition(
-                                    term=term,
-                                    definition=definition,
-                                    referenced_from=[para.paragraph_id]
-                                ))
+                    for match in _iter_definition_matches(para.content):
+                        term = match.group(1).strip()
+                        definition = match.group(2).strip()
+                        
+                        if len(term) > 2 and len(definition) > 10:
+                            definitions.append(Definition(
+                                term=term,
+                                definition=definition,
+                                referenced_from=[para.paragraph_id]
+                            ))
             # If found in Appendix A, return early
             if definitions:
                 return definitions
@@ -1389,22 +1304,16 @@ class SimpleStrategy(ParsingStrategy):
                 # Check if this is paragraph 6 (IAS_16:6)
                 if para.paragraph_id == f"{standard_id}:6":
                     # Look for definition patterns in paragraph 6 content
-                    definition_patterns = [
-                        r"([\u0590-\u05FF\w\s]{3,50})\s*[:–—]\s*(.+?)(?=\n|$)",  # Hebrew term: definition
-                        r"([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s*means?\s+(.+?)(?=\n|$)",  # English term means definition
-                    ]
-                    for pattern in definition_patterns:
-                        matches = re.finditer(pattern, para.content, re.MULTILINE | re.IGNORECASE)
-                        for match in matches:
-                            term = match.group(1).strip()
-                            definition = match.group(2).strip()
-                            
-                            if len(term) > 2 and len(definition) > 10:
-                                definitions.append(Definition(
-                                    term=term,
-                                    definition=definition,
-                                    referenced_from=[para.paragraph_id]
-                                ))
+                    for match in _iter_definition_matches(para.content):
+                        term = match.group(1).strip()
+                        definition = match.group(2).strip()
+                        
+                        if len(term) > 2 and len(definition) > 10:
+                            definitions.append(Definition(
+                                term=term,
+                                definition=definition,
+                                referenced_from=[para.paragraph_id]
+                            ))
                     break
         
         return definitions
@@ -1413,20 +1322,18 @@ class SimpleStrategy(ParsingStrategy):
         """Extract untranslated sections."""
         exclusions = Exclusions(untranslated_sections=[])
         
-        exclusion_markers = [
-            "לא תורגם",
-            "not translated",
-            "untranslated",
-            "under translation"
-        ]
-        
         for page_num, text, metadata in structured_text:
-            for marker in exclusion_markers:
-                if marker.lower() in text.lower():
+            # Lower the page once; its lines line up with the original ones
+            lowered_text = text.lower()
+            lines = None
+            for marker in _EXCLUSION_MARKERS:
+                if marker in lowered_text:
                     # Try to identify the section
-                    lines = text.split("\n")
-                    for i, line in enumerate(lines):
-                        if marker.lower() in line.lower():
+                    if lines is None:
+                        lines = text.split("\n")
+                        lowered_lines = lowered_text.split("\n")
+                    for i, lowered_line in enumerate(lowered_lines):
+                        if marker in lowered_line:
                             # Look for section title nearby
                             section_title = None
                             for j in range(max(0, i-3), min(len(lines), i+3)):
@@ -1,6 +1,6 @@
 """Data models for PDF to JSON conversion."""
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Tuple
 from pydantic import BaseModel, Field
 
 
@@ -94,6 +94,28 @@ class StandardDocument(BaseModel):
     appendix_C: Optional[Appendix] = None
     definitions: List[Definition] = []
     exclusions: Exclusions = Field(default_factory=Exclusions)
+    
+    def iter_paragraphs(self) -> Iterator[Tuple[Paragraph, str]]:
+        """Yield every paragraph with the part it came from.
+        
+        Walks main content first, then appendices A, B and C, visiting each
+        section's paragraphs before its subsections' paragraphs.
+        
+        Yields:
+            (paragraph, source) tuples, where source is "main" or "appendix_<id>"
+        """
+        parts = [("main", self.main)]
+        for appendix in (self.appendix_A, self.appendix_B, self.appendix_C):
+            if appendix:
+                parts.append((f"appendix_{appendix.appendix_id}", appendix))
+        
+        for source, part in parts:
+            for section in part.sections:
+                for para in section.paragraphs:
+                    yield para, source
+                for sub in section.subsections:
+                    for para in sub.paragraphs:
+                        yield para, source
 
 
 # QA Models
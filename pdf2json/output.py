@@ -1,11 +1,66 @@
 """Output generation for JSON and HTML reports."""
 
 import json
+import os
 import re
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Any, Optional, Dict
 from pdf2json.models import StandardDocument, QADocument
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is used otherwise
+    orjson = None
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write bytes to path via a sibling temp file and os.replace.
+    
+    Readers never see a half-written file, and a crash mid-write leaves any
+    previous output in place.
+    
+    Args:
+        path: Destination file path
+        data: File contents
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_text_file(path: Path, text: str) -> None:
+    """Atomically write text as UTF-8.
+    
+    Args:
+        path: Destination file path
+        text: File contents
+    """
+    _atomic_write_bytes(path, text.encode('utf-8'))
+
+
+def write_json_file(path: Path, data: Any) -> None:
+    """Atomically write data as indented UTF-8 JSON.
+    
+    Uses orjson when it is installed and falls back to the stdlib encoder
+    for payloads orjson rejects (e.g. lone surrogates from PDF text).
+    
+    Args:
+        path: Destination file path
+        data: JSON-serializable data
+    """
+    if orjson is not None:
+        try:
+            _atomic_write_bytes(path, orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            return
+        except orjson.JSONEncodeError:
+            pass
+    _atomic_write_bytes(path, json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8'))
+
 
 class OutputGenerator:
     """Generates JSON and HTML output files."""
@@ -33,8 +88,7 @@ class OutputGenerator:
         # Convert to dict and serialize
         doc_dict = document.model_dump(mode='json', exclude_none=False)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(doc_dict, f, ensure_ascii=False, indent=2)
+        write_json_file(output_path, doc_dict)
         
         return output_path
     
@@ -52,8 +106,7 @@ class OutputGenerator:
         # Convert to dict and serialize
         qa_dict = qa_document.model_dump(mode='json', exclude_none=False)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(qa_dict, f, ensure_ascii=False, indent=2)
+        write_json_file(output_path, qa_dict)
         
         return output_path
     
@@ -72,8 +125,7 @@ class OutputGenerator:
         
         html_content = self._generate_html_content(document, qa_document, baseline_text)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        write_text_file(output_path, html_content)
         
         return output_path
     
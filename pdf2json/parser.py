@@ -1,6 +1,6 @@
 """Baseline PDF text extraction using PyMuPDF."""
 
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Optional
 import fitz  # PyMuPDF
 import re
 
@@ -17,10 +17,14 @@ class PDFTextExtractor:
         self.pdf_path = pdf_path
         self.doc: fitz.Document = None
         self._header_footer_lines: set = None
+        self._baseline_text: Optional[str] = None
+        self._positioned_lines: Optional[List[Dict[str, Any]]] = None
     
     def __enter__(self):
         """Context manager entry."""
         self.doc = fitz.open(self.pdf_path)
+        self._baseline_text = None
+        self._positioned_lines = None
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -31,19 +35,26 @@ class PDFTextExtractor:
     def extract_baseline_text(self) -> str:
         """Extract baseline text content from PDF for QA comparison.
         
+        The text is extracted once per open document and cached, so the CLI
+        and every parsing strategy can call this without re-decoding pages.
+        
         Returns:
             Complete text content as a single string
         """
         if not self.doc:
             raise ValueError("PDF document not open. Use context manager.")
         
+        if self._baseline_text is not None:
+            return self._baseline_text
+        
         text_parts = []
         for page_num in range(len(self.doc)):
             page = self.doc[page_num]
             text = page.get_text()
             text_parts.append(text)
         
-        return "\n\n".join(text_parts)
+        self._baseline_text = "\n\n".join(text_parts)
+        return self._baseline_text
     
     def _detect_header_footer_lines(self, all_lines: List[Dict[str, Any]], threshold: float = 0.5) -> set:
         """Detect header/footer lines by high repetition across pages.
@@ -83,6 +94,8 @@ class PDFTextExtractor:
         """Extract text as positioned lines/blocks with bbox information.
         
         Reconstructs reading order for RTL: sort by y (top->bottom), then x (right->left).
+        The lines are extracted once per open document and cached, like the baseline
+        text; callers share the returned list and must not modify it.
         
         Returns:
             List of line dictionaries: {page, y, x, text, bbox}
@@ -90,6 +103,9 @@ class PDFTextExtractor:
         if not self.doc:
             raise ValueError("PDF document not open. Use context manager.")
         
+        if self._positioned_lines is not None:
+            return self._positioned_lines
+        
         all_lines: List[Dict[str, Any]] = []
         
         for page_num in range(len(self.doc)):
@@ -160,6 +176,7 @@ class PDFTextExtractor:
             header_footer = self._detect_header_footer_lines(all_lines)
             all_lines = [line for line in all_lines if line["text"].strip() not in header_footer]
         
+        self._positioned_lines = all_lines
         return all_lines
     
     def extract_text_with_structure(self) -> List[Tuple[int, str, dict]]:
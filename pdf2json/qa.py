@@ -1,8 +1,8 @@
 """QA validation module."""
 
 import re
-from typing import Dict, List, Tuple, Set
-from pdf2json.models import StandardDocument, QADocument, QACheck
+from typing import Dict, List, Optional, Tuple, Set
+from pdf2json.models import StandardDocument, QADocument, QACheck, Paragraph
 
 
 class QAValidator:
@@ -16,12 +16,15 @@ class QAValidator:
         """
         self.threshold = threshold
     
-    def validate(self, document: StandardDocument, baseline_text: str) -> QADocument:
+    def validate(self, document: StandardDocument, baseline_text: str,
+                 paragraphs: Optional[List[Tuple[Paragraph, str]]] = None) -> QADocument:
         """Run QA validation on a parsed document.
         
         Args:
             document: The parsed StandardDocument
             baseline_text: Baseline text extracted from PDF for comparison
+            paragraphs: Optional list(document.iter_paragraphs()) if the caller
+                has already flattened the document
             
         Returns:
             QADocument with validation results
@@ -30,12 +33,11 @@ class QAValidator:
         issues: List[str] = []
         warnings: List[str] = []
         
+        if paragraphs is None:
+            paragraphs = list(document.iter_paragraphs())
+        
         # Hard gate: Check body paragraphs == 0 (must fail immediately)
-        total_paragraphs = sum(
-            len(section.paragraphs) + sum(len(sub.paragraphs) for sub in section.subsections)
-            for section in document.main.sections
-        )
-        if total_paragraphs == 0:
+        if not any(source == "main" for _, source in paragraphs):
             issues.append("HARD FAIL: Body paragraphs == 0")
             # Return failed QA immediately
             return QADocument(
@@ -49,7 +51,7 @@ class QAValidator:
             )
         
         # Check 0: TOC contamination (SPEC 13.2.2) - MUST FAIL if TOC appears in normative parts
-        toc_contamination_score, toc_issues = self._check_toc_contamination(document, baseline_text)
+        toc_contamination_score, toc_issues = self._check_toc_contamination(document, baseline_text, paragraphs)
         checks["toc_contamination"] = QACheck(
             name="TOC Contamination",
             score=toc_contamination_score,
@@ -63,7 +65,7 @@ class QAValidator:
             pass
         
         # Check 1: Structure completeness
-        structure_score = self._check_structure_completeness(document)
+        structure_score = self._check_structure_completeness(document, paragraphs)
         checks["structure_completeness"] = QACheck(
             name="Structure Completeness",
             score=structure_score,
@@ -74,7 +76,7 @@ class QAValidator:
             issues.append(f"Structure completeness below threshold: {structure_score:.2f} < {self.threshold:.2f}")
         
         # Check 2: Paragraph numbering
-        para_score, para_issues = self._check_paragraph_numbering(document, baseline_text)
+        para_score, para_issues = self._check_paragraph_numbering(document, baseline_text, paragraphs)
         checks["paragraph_numbering"] = QACheck(
             name="Paragraph Numbering",
             score=para_score,
@@ -84,7 +86,7 @@ class QAValidator:
         issues.extend(para_issues)
         
         # Check 3: Table detection (optional - don't penalize if none found and none in baseline)
-        table_score, table_issues = self._check_table_detection(document, baseline_text)
+        table_score, table_issues = self._check_table_detection(document, baseline_text, paragraphs)
         checks["table_detection"] = QACheck(
             name="Table Detection",
             score=table_score,
@@ -106,7 +108,7 @@ class QAValidator:
         issues.extend(def_issues)
         
         # Check 5: Footnote linking (optional - don't penalize if none found and none in baseline)
-        footnote_score, footnote_issues = self._check_footnote_linking(document, baseline_text)
+        footnote_score, footnote_issues = self._check_footnote_linking(document, baseline_text, paragraphs)
         checks["footnote_linking"] = QACheck(
             name="Footnote Linking",
             score=footnote_score,
@@ -152,7 +154,7 @@ class QAValidator:
             warnings=warnings
         )
     
-    def _check_structure_completeness(self, document: StandardDocument) -> float:
+    def _check_structure_completeness(self, document: StandardDocument, paragraphs: List[Tuple[Paragraph, str]]) -> float:
         """Check if document has expected structure elements.
         
         Returns:
@@ -175,10 +177,7 @@ class QAValidator:
             score -= 0.2
         
         # Check 3: Has at least some paragraphs (including appendices)
-        total_paragraphs = sum(
-            len(section.paragraphs) + sum(len(sub.paragraphs) for sub in section.subsections)
-            for section in document.main.sections
-        )
+        total_paragraphs = sum(1 for _, source in paragraphs if source == "main")
         
         # HARD FAIL: Body paragraphs must be > 0
         if total_paragraphs == 0:
@@ -186,13 +185,7 @@ class QAValidator:
             return score
         
         # Count appendices paragraphs (primary normative content per SPEC 9.1)
-        appendix_paragraphs = 0
-        for appendix in [document.appendix_A, document.appendix_B, document.appendix_C]:
-            if appendix:
-                appendix_paragraphs += sum(
-                    len(section.paragraphs) + sum(len(sub.paragraphs) for sub in section.subsections)
-                    for section in appendix.sections
-                )
+        appendix_paragraphs = len(paragraphs) - total_paragraphs
         
         total_paragraphs_all = total_paragraphs + appendix_paragraphs
         
@@ -327,7 +320,7 @@ class QAValidator:
         
         return expected_numbers
     
-    def _check_toc_contamination(self, document: StandardDocument, baseline_text: str) -> Tuple[float, List[str]]:
+    def _check_toc_contamination(self, document: StandardDocument, baseline_text: str, paragraphs: List[Tuple[Paragraph, str]]) -> Tuple[float, List[str]]:
         """Check for TOC contamination in normative parts (SPEC 13.2.2).
         
         Returns:
@@ -336,35 +329,19 @@ class QAValidator:
         issues: List[str] = []
         toc_pattern = re.compile(r'תוכן\s+עניינים', re.IGNORECASE)
         
-        # Check main content
-        for section in document.main.sections:
-            for para in section.paragraphs:
-                if toc_pattern.search(para.content):
+        # Check main content, then appendices (also normative)
+        for para, source in paragraphs:
+            if toc_pattern.search(para.content):
+                if source == "main":
                     issues.append(f"TOC content found in main content paragraph {para.paragraph_id}")
-                    return 0.0, issues
-            for sub in section.subsections:
-                for para in sub.paragraphs:
-                    if toc_pattern.search(para.content):
-                        issues.append(f"TOC content found in main content paragraph {para.paragraph_id}")
-                        return 0.0, issues
-        
-        # Check appendices (also normative)
-        for appendix in [document.appendix_A, document.appendix_B, document.appendix_C]:
-            if appendix:
-                for section in appendix.sections:
-                    for para in section.paragraphs:
-                        if toc_pattern.search(para.content):
-                            issues.append(f"TOC content found in appendix {appendix.appendix_id} paragraph {para.paragraph_id}")
-                            return 0.0, issues
-                    for sub in section.subsections:
-                        for para in sub.paragraphs:
-                            if toc_pattern.search(para.content):
-                                issues.append(f"TOC content found in appendix {appendix.appendix_id} paragraph {para.paragraph_id}")
-                                return 0.0, issues
+                else:
+                    appendix_id = source[len("appendix_"):]
+                    issues.append(f"TOC content found in appendix {appendix_id} paragraph {para.paragraph_id}")
+                return 0.0, issues
         
         return 1.0, issues
     
-    def _check_paragraph_numbering(self, document: StandardDocument, baseline_text: str) -> Tuple[float, List[str]]:
+    def _check_paragraph_numbering(self, document: StandardDocument, baseline_text: str, paragraphs: List[Tuple[Paragraph, str]]) -> Tuple[float, List[str]]:
         """Check paragraph numbering consistency.
         
         Derives expected paragraph numbers from baseline and scores based on coverage
@@ -405,14 +382,7 @@ class QAValidator:
             return 0.0, ["No paragraphs found"]
         
         # Check 1.5: HARD FAIL if IAS_16:1 (display ".1") is not found in main content
-        main_paragraph_ids = [
-            para.paragraph_id
-            for section in document.main.sections
-            for para in section.paragraphs
-        ]
-        for section in document.main.sections:
-            for subsec in section.subsections:
-                main_paragraph_ids.extend([para.paragraph_id for para in subsec.paragraphs])
+        main_paragraph_ids = [para.paragraph_id for para, source in paragraphs if source == "main"]
         
         standard_prefix = f"{document.standard_id}:"
         expected_first_id = f"{standard_prefix}1"
@@ -490,7 +460,7 @@ class QAValidator:
         
         return score, issues
     
-    def _check_table_detection(self, document: StandardDocument, baseline_text: str) -> Tuple[float, List[str]]:
+    def _check_table_detection(self, document: StandardDocument, baseline_text: str, paragraphs: List[Tuple[Paragraph, str]]) -> Tuple[float, List[str]]:
         """Check table detection quality.
         
         Returns:
@@ -500,22 +470,13 @@ class QAValidator:
         total_tables = 0
         valid_tables = 0
         
-        def count_tables(section):
-            nonlocal total_tables, valid_tables
-            for para in section.paragraphs:
-                for table in para.tables:
-                    total_tables += 1
-                    if table.headers or table.rows:
-                        valid_tables += 1
-            for sub in section.subsections:
-                for para in sub.paragraphs:
-                    for table in para.tables:
-                        total_tables += 1
-                        if table.headers or table.rows:
-                            valid_tables += 1
-        
-        for section in document.main.sections:
-            count_tables(section)
+        for para, source in paragraphs:
+            if source != "main":
+                continue
+            for table in para.tables:
+                total_tables += 1
+                if table.headers or table.rows:
+                    valid_tables += 1
         
         if total_tables == 0:
             # Check if tables are mentioned in baseline (simple heuristic)
@@ -558,7 +519,7 @@ class QAValidator:
         
         return score, issues
     
-    def _check_footnote_linking(self, document: StandardDocument, baseline_text: str) -> Tuple[float, List[str]]:
+    def _check_footnote_linking(self, document: StandardDocument, baseline_text: str, paragraphs: List[Tuple[Paragraph, str]]) -> Tuple[float, List[str]]:
         """Check footnote linking quality.
         
         Returns:
@@ -568,22 +529,13 @@ class QAValidator:
         total_footnotes = 0
         linked_footnotes = 0
         
-        def count_footnotes(section):
-            nonlocal total_footnotes, linked_footnotes
-            for para in section.paragraphs:
-                for footnote in para.footnotes:
-                    total_footnotes += 1
-                    if footnote.referenced_paragraph_id == para.paragraph_id:
-                        linked_footnotes += 1
-            for sub in section.subsections:
-                for para in sub.paragraphs:
-                    for footnote in para.footnotes:
-                        total_footnotes += 1
-                        if footnote.referenced_paragraph_id == para.paragraph_id:
-                            linked_footnotes += 1
-        
-        for section in document.main.sections:
-            count_footnotes(section)
+        for para, source in paragraphs:
+            if source != "main":
+                continue
+            for footnote in para.footnotes:
+                total_footnotes += 1
+                if footnote.referenced_paragraph_id == para.paragraph_id:
+                    linked_footnotes += 1
         
         if total_footnotes == 0:
             # Check if footnotes are mentioned in baseline (simple heuristic)